@@ -0,0 +1,86 @@
+"""
+Batch vs per-object account balances
+
+Builds N mixed Account/SavingsAccount/CheckingAccount objects and times
+compute_balances() against one balance call per account (_balance(), the
+same rule as show_balance() without the print) and against show_balance()
+itself with output discarded.
+
+Run: python benchmarks/bench_balances.py --accounts 1000000
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import midterm2
+
+
+def make_accounts(count, seed=0):
+    rng = random.Random(seed)
+    accounts = []
+    for _ in range(count):
+        deposit, withdraw, extra = rng.random() * 1000, rng.random() * 100, rng.random() * 10
+        kind = rng.randrange(3)
+        if kind == 0:
+            accounts.append(midterm2.Account(deposit, withdraw))
+        elif kind == 1:
+            accounts.append(midterm2.SavingsAccount(deposit, withdraw, extra))
+        else:
+            accounts.append(midterm2.CheckingAccount(deposit, withdraw, extra))
+    return accounts
+
+
+def best_time(func, repeat):
+    """Fastest of `repeat` runs, with the garbage collector off."""
+    best = float("inf")
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return best
+
+
+def show_all(accounts):
+    with contextlib.redirect_stdout(io.StringIO()):
+        for account in accounts:
+            account.show_balance()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--accounts", type=int, default=1000000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    accounts = make_accounts(args.accounts)
+    expected = [midterm2._balance(a) for a in accounts]
+    if list(midterm2.compute_balances(accounts).balances) != expected:
+        raise SystemExit("compute_balances() disagrees with the per-object balances")
+
+    batch = best_time(lambda: midterm2.compute_balances(accounts), args.repeat)
+    per_object = best_time(lambda: [midterm2._balance(a) for a in accounts], args.repeat)
+    shown = best_time(lambda: show_all(accounts), 1)
+
+    n = len(accounts)
+    print(f"compute_balances(): {n / batch:12,.0f} accounts/sec")
+    print(f"per-object calls:   {n / per_object:12,.0f} accounts/sec "
+          f"({per_object / batch:.2f}x slower)")
+    print(f"show_balance():     {n / shown:12,.0f} accounts/sec "
+          f"({shown / batch:.1f}x slower)")
+
+
+if __name__ == "__main__":
+    main()
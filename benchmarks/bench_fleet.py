@@ -0,0 +1,64 @@
+"""
+Smart-home fleet controller load generator
+
+Builds a fleet of quiet smart_home twins, runs several producer coroutines
+that submit random commands, and reports commands/sec and apply latency.
+
+Run: python benchmarks/bench_fleet.py --homes 50000 --commands 1000000
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import digital_twin_fleet as fleet
+
+
+async def produce(controller, homes, commands, burst, seed):
+    rng = random.Random(seed)
+    for sent in range(0, commands, burst):
+        for _ in range(min(burst, commands - sent)):
+            home_id = rng.randrange(homes)
+            command = rng.choice(fleet.COMMANDS)
+            if command == "set_temperature":
+                controller.submit(home_id, command, rng.randint(60, 80))
+            elif command in ("set_security", "set_lights"):
+                controller.submit(home_id, command, rng.random() < 0.5)
+            else:
+                controller.submit(home_id, command)
+        await asyncio.sleep(0)
+
+
+async def run(args):
+    homes = fleet.make_fleet(args.homes)
+    controller = fleet.FleetController(homes, batch_size=args.batch_size)
+    controller.start()
+    per_producer = args.commands // args.producers
+    await asyncio.gather(*(
+        produce(controller, args.homes, per_producer, args.burst, seed)
+        for seed in range(args.producers)
+    ))
+    await controller.stop()
+    return controller.stats()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--homes", type=int, default=20000)
+    parser.add_argument("--commands", type=int, default=500000)
+    parser.add_argument("--producers", type=int, default=8)
+    parser.add_argument("--burst", type=int, default=500)
+    parser.add_argument("--batch-size", type=int, default=4096)
+    args = parser.parse_args()
+
+    stats = asyncio.run(run(args))
+    for key, value in stats.items():
+        print(f"{key:>17}: {value:,.3f}" if isinstance(value, float) else f"{key:>17}: {value:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Mad Libs rendering benchmark
+
+Writes a word-bank CSV, then renders every row with the compiled template
+(render_many) and, for comparison, by re-compiling the template per story.
+With --distinct N the file repeats N distinct word banks, and the cached
+pipeline (read_word_rows + render_rows) is timed against rendering every
+row.
+
+Run: python benchmarks/bench_madlib.py --stories 1000000 --distinct 50000
+"""
+
+import argparse
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "madlib"))
+
+import madlibgenerator as madlib
+
+FIELDS = ["noun", "verb", "adjective", "place", "emotion", "animal", "celebrity", "object"]
+WORDS = ["dragon", "soar", "sparkly", "Enchanted Forest", "amazed", "phoenix",
+         "Taylor Swift", "crystal", "teapot", "wobble", "grumpy", "Paris"]
+
+
+def write_word_banks(filename, rows, seed=0, distinct=None):
+    rng = random.Random(seed)
+    pool = None
+    if distinct:
+        pool = [[rng.choice(WORDS) for _ in FIELDS] for _ in range(distinct)]
+    with open(filename, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(FIELDS)
+        for _ in range(rows):
+            writer.writerow(rng.choice(pool) if pool else [rng.choice(WORDS) for _ in FIELDS])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--stories", type=int, default=1000000)
+    parser.add_argument("--distinct", type=int, default=None,
+                        help="distinct word banks in the file (default: all random)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, "words.csv")
+        write_word_banks(filename, args.stories, distinct=args.distinct)
+
+        start = time.perf_counter()
+        word_banks = list(madlib.read_word_banks(filename))
+        read_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        rows = list(madlib.read_word_rows(filename))
+        rows_time = time.perf_counter() - start
+
+    template = madlib.load_template()
+    start = time.perf_counter()
+    total = sum(len(story) for story in template.render_many(word_banks))
+    compiled_time = time.perf_counter() - start
+
+    with open(madlib.DEFAULT_TEMPLATE, encoding="utf-8") as f:
+        text = f.read()
+    sample = word_banks[:max(1, len(word_banks) // 20)]
+    start = time.perf_counter()
+    for word_bank in sample:
+        madlib.StoryTemplate(text).render(word_bank)
+    reparse_rate = len(sample) / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for words in rows:
+        template.render_words(words)
+    uncached_time = time.perf_counter() - start
+
+    cache = madlib.StoryCache()
+    start = time.perf_counter()
+    for _ in madlib.render_rows(rows, template, cache):
+        pass
+    cached_time = time.perf_counter() - start
+
+    print(f"read CSV:        {len(word_banks) / read_time:12,.0f} word banks/sec")
+    print(f"compiled render: {len(word_banks) / compiled_time:12,.0f} stories/sec "
+          f"({total / compiled_time / 1e6:.0f} MB/sec)")
+    print(f"re-parse render: {reparse_rate:12,.0f} stories/sec")
+    print(f"read word rows:  {len(rows) / rows_time:12,.0f} rows/sec")
+    print(f"render rows:     {len(rows) / uncached_time:12,.0f} stories/sec (every row)")
+    print(f"cached render:   {len(rows) / cached_time:12,.0f} stories/sec "
+          f"({cache.hits / max(1, len(rows)):.0%} cache hits, "
+          f"{uncached_time / cached_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Game server load test
+
+Starts game/server.py in a separate process, opens N concurrent client
+connections, has every client play a few commands at once, and reports
+sessions/sec and command round-trip latency.
+
+Run: python benchmarks/bench_server.py --connections 1000 10000 50000
+(large levels need a high open-file limit: ulimit -n)
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import resource
+import subprocess
+import sys
+import time
+
+SERVER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "game", "server.py")
+PROMPT = b"> "
+
+
+def raise_file_limit():
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft != hard:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+    return hard
+
+
+async def connect(port, index, connect_limit):
+    async with connect_limit:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port, limit=1 << 16)
+        await reader.readuntil(b": ")
+        writer.write(f"Bot{index}\n".encode())
+        await reader.readuntil(PROMPT)
+    return reader, writer
+
+
+async def play(reader, writer, commands, latencies, seed):
+    rng = random.Random(seed)
+    answer = None
+    for _ in range(commands):
+        command = answer or rng.choice(("explore", "explore", "status"))
+        start = time.perf_counter()
+        writer.write(command.encode() + b"\n")
+        try:
+            text = await reader.readuntil(PROMPT)
+        except asyncio.IncompleteReadError:
+            return  # game over, server closed the session
+        latencies.append(time.perf_counter() - start)
+        answer = "fight" if b"[fight]" in text else None
+    if answer:
+        # A pending fight/run prompt would take "quit" as its answer
+        writer.write(b"run\n")
+        try:
+            await reader.readuntil(PROMPT)
+        except asyncio.IncompleteReadError:
+            return
+    writer.write(b"quit\n")
+    await reader.read()
+    writer.close()
+
+
+async def run_level(port, connections, commands):
+    connect_limit = asyncio.Semaphore(512)
+    latencies = []
+    start = time.perf_counter()
+    clients = await asyncio.gather(*(
+        connect(port, i, connect_limit) for i in range(connections)))
+    connected = time.perf_counter()
+    await asyncio.gather(*(
+        play(reader, writer, commands, latencies, i)
+        for i, (reader, writer) in enumerate(clients)))
+    done = time.perf_counter()
+
+    latencies.sort()
+
+    def pct(p):
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p / 100))] * 1000
+
+    print(f"{connections:>8,} {connections / (done - start):>13,.0f} "
+          f"{connected - start:>10.2f} {len(latencies) / (done - connected):>12,.0f} "
+          f"{pct(50):>8.2f} {pct(99):>8.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--connections", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--commands", type=int, default=10, help="commands per session")
+    args = parser.parse_args()
+
+    limit = raise_file_limit()
+    if max(args.connections) + 100 > limit:
+        print(f"Warning: open-file limit is {limit}; large levels may fail")
+
+    server = subprocess.Popen([sys.executable, SERVER, "--port", "0"],
+                              stdout=subprocess.PIPE, text=True)
+    try:
+        port = int(server.stdout.readline().rsplit(":", 1)[1])
+        print(f"{'conns':>8} {'sessions/s':>13} {'connect s':>10} {'commands/s':>12} "
+              f"{'p50 ms':>8} {'p99 ms':>8}")
+        for connections in args.connections:
+            asyncio.run(run_level(port, connections, args.commands))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Game output sink benchmark
+
+Runs the same seeded explore loop with each output sink and reports
+explores/sec. The console sink prints to /dev/null so the terminal is not
+part of the measurement.
+
+Run: python benchmarks/bench_sinks.py --explores 200000
+"""
+
+import argparse
+import contextlib
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "game"))
+
+from game import BufferedSink, ConsoleSink, EventSink, Game, NullSink
+from simulate import CautiousPolicy
+
+
+def explore_loop(make_sink, explores, steps_per_game=50):
+    """Play `explores` explore steps in fresh 50-step games; return seconds."""
+    policy = CautiousPolicy()
+    done = 0
+    seed = 0
+    start = time.perf_counter()
+    while done < explores:
+        sink = make_sink()
+        game = Game("Bench", policy=policy, seed=seed, sink=sink)
+        for _ in range(min(steps_per_game, explores - done)):
+            game.explore()
+        done += steps_per_game
+        seed += 1
+        if isinstance(sink, BufferedSink):
+            sink.flush()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--explores", type=int, default=200000)
+    args = parser.parse_args()
+
+    with open(os.devnull, "w") as devnull:
+        sinks = [
+            ("console", ConsoleSink),
+            ("buffered", lambda: BufferedSink(devnull, limit=4096)),
+            ("structured", EventSink),
+            ("null", NullSink),
+        ]
+        with contextlib.redirect_stdout(devnull):
+            results = [(name, explore_loop(make, args.explores)) for name, make in sinks]
+
+    baseline = results[0][1]
+    for name, seconds in results:
+        print(f"{name:>10}: {args.explores / seconds:10,.0f} explores/sec "
+              f"({baseline / seconds:.1f}x console)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Slotted vs unslotted memory/throughput benchmark
+
+Creates N instances of each class and its __slots__ variant and reports
+construction rate and traced memory per instance.
+
+Run: python benchmarks/bench_slots.py --instances 1000000
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path[:0] = [ROOT, os.path.join(ROOT, "game")]
+
+import carcode
+import digital_twin
+import midterm2
+from game import Player, SlottedPlayer
+
+# (label, plain class, slotted class, constructor args)
+CASES = [
+    ("Player", Player, SlottedPlayer, ("Hero",)),
+    ("Student", midterm2.Student, midterm2.SlottedStudent, ("Ada", "3.9", "Math")),
+    ("Product", midterm2.Product, midterm2.SlottedProduct, ("Bread", 5)),
+    ("Car", carcode.Car, carcode.SlottedCar, ("Ford", "Mustang", 1967)),
+    ("eCar", carcode.eCar, carcode.SlottedECar, ("Tesla", "Model S", 2020, 100)),
+    ("gasCar", carcode.gasCar, carcode.SlottedGasCar, ("Ford", "Mustang", 1967, "gas")),
+    ("smart_home", digital_twin.smart_home, digital_twin.slotted_smart_home, (70, False, False)),
+]
+
+
+def measure(cls, args, count):
+    """Return (instances/sec, bytes/instance) for building `count` objects."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    objects = [cls(*args) for _ in range(count)]
+    elapsed = time.perf_counter() - start
+    size, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return count / elapsed, size / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--instances", type=int, default=1000000)
+    args = parser.parse_args()
+
+    print(f"{'class':<11} {'plain B/obj':>12} {'slotted B/obj':>14} {'saved':>6} "
+          f"{'plain obj/s':>13} {'slotted obj/s':>14}")
+    for label, plain, slotted, ctor_args in CASES:
+        plain_rate, plain_size = measure(plain, ctor_args, args.instances)
+        slot_rate, slot_size = measure(slotted, ctor_args, args.instances)
+        saved = 1 - slot_size / plain_size
+        print(f"{label:<11} {plain_size:>12.0f} {slot_size:>14.0f} {saved:>6.0%} "
+              f"{plain_rate:>13,.0f} {slot_rate:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+Player snapshot benchmark
+
+Saves and loads the same players with PlayerStore (game/snapshot.py), JSON
+and pickle, and reports players/sec and file size. Also times a top-10
+leaderboard, which PlayerStore answers from the score and name columns
+while the baselines must load everything.
+
+Run: python benchmarks/bench_snapshot.py --players 1000000
+"""
+
+import argparse
+import json
+import os
+import pickle
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "game"))
+
+from game import Game, Player
+from snapshot import PlayerStore, leaderboard, read_columns
+
+
+def make_players(count, seed=0):
+    """Players with random stats and a few inventory items each."""
+    rng = random.Random(seed)
+    locations = list(Game.LOCATIONS)
+    loot = [item["name"] for item in Game.LOOT]
+    players = []
+    for i in range(count):
+        player = Player(f"Player{i}")
+        player.health = rng.randint(0, 100)
+        player.score = rng.randint(-50, 2000)
+        player.location = rng.choice(locations)
+        for _ in range(rng.randint(0, 6)):
+            player.inventory.append(rng.choice(loot))
+        players.append(player)
+    return players
+
+
+def to_dict(player):
+    return {"name": player.name, "health": player.health, "max_health": player.max_health,
+            "score": player.score, "location": player.location,
+            "inventory": dict(player.inventory.items())}
+
+
+def from_dict(data):
+    player = Player(data["name"])
+    player.health = data["health"]
+    player.max_health = data["max_health"]
+    player.score = data["score"]
+    player.location = data["location"]
+    for item, count in data["inventory"].items():
+        player.inventory.append(item, count)
+    return player
+
+
+def top(players, n=10):
+    return [(p.name, p.score) for p in sorted(players, key=lambda p: p.score, reverse=True)[:n]]
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def bench_store(players, path):
+    save, _ = timed(lambda: PlayerStore.from_players(players).save(path))
+
+    def load_all():
+        with PlayerStore.open(path) as store:
+            return list(store.players())
+
+    load, loaded = timed(load_all)
+    board, best = timed(lambda: leaderboard(path, 10))
+    column, _ = timed(lambda: read_columns(path, ("score",)))
+    return save, load, board, column, loaded, best
+
+
+def bench_json(players, path):
+    def save():
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump([to_dict(p) for p in players], file)
+
+    def load():
+        with open(path, encoding="utf-8") as file:
+            return [from_dict(d) for d in json.load(file)]
+
+    save_time, _ = timed(save)
+    load_time, loaded = timed(load)
+    board, best = timed(lambda: top(load()))
+    return save_time, load_time, board, None, loaded, best
+
+
+def bench_pickle(players, path):
+    def save():
+        with open(path, "wb") as file:
+            pickle.dump(players, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def load():
+        with open(path, "rb") as file:
+            return pickle.load(file)
+
+    save_time, _ = timed(save)
+    load_time, loaded = timed(load)
+    board, best = timed(lambda: top(load()))
+    return save_time, load_time, board, None, loaded, best
+
+
+def same(a, b):
+    return all((p.name, p.health, p.score, p.location, p.inventory)
+               == (q.name, q.health, q.score, q.location, q.inventory) for p, q in zip(a, b))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--players", type=int, default=1000000)
+    args = parser.parse_args()
+
+    players = make_players(args.players)
+    expected = top(players)
+    print(f"{args.players:,} players")
+    print(f"{'format':>8} {'MB':>8} {'save/s':>12} {'load/s':>12} "
+          f"{'top-10 ms':>10} {'scores ms':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, bench in (("store", bench_store), ("json", bench_json),
+                            ("pickle", bench_pickle)):
+            path = os.path.join(tmp, f"players.{name}")
+            save, load, board, column, loaded, best = bench(players, path)
+            if not same(players, loaded) or [s for _, s in best] != [s for _, s in expected]:
+                print(f"{name}: round trip mismatch")
+                raise SystemExit(1)
+            size = os.path.getsize(path) / 1e6
+            scores = f"{column * 1000:10.1f}" if column is not None else f"{'-':>10}"
+            print(f"{name:>8} {size:8.1f} {args.players / save:12,.0f} "
+                  f"{args.players / load:12,.0f} {board * 1000:10.1f} {scores}")
+
+
+if __name__ == "__main__":
+    main()
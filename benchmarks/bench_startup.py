@@ -0,0 +1,96 @@
+"""
+Import-time budget check
+
+Imports each module in a fresh interpreter with `python -X importtime`,
+takes the best cumulative time over several runs and compares it with the
+module's budget. Bytecode is cached in a temporary directory (the first
+run warms it), so the numbers are warm-start times even when
+PYTHONDONTWRITEBYTECODE is set. A module also fails if importing it prints
+anything or waits for input: imports must not have side effects.
+
+Exits with status 1 if any module is over budget.
+
+Run: python benchmarks/bench_startup.py --runs 5
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+# module -> (directory to import from, budget in ms)
+BUDGETS = {
+    "carcode": (ROOT, 10),
+    "digital_twin": (ROOT, 10),
+    "digital_twin_fleet": (ROOT, 150),  # asyncio alone is most of this
+    "midterm2": (ROOT, 30),
+    "pythonquiz2": (ROOT, 5),
+    "madlibgenerator": (os.path.join(ROOT, "madlib"), 40),
+    "game": (os.path.join(ROOT, "game"), 10),
+    "simulate": (os.path.join(ROOT, "game"), 15),
+    "replay": (os.path.join(ROOT, "game"), 15),
+    "snapshot": (os.path.join(ROOT, "game"), 15),
+    "server": (os.path.join(ROOT, "game"), 150),  # asyncio
+}
+
+
+def import_time(module, directory, env, timeout=30):
+    """Cumulative import time of module in microseconds, and anything it printed."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=directory, env=env, stdin=subprocess.DEVNULL, capture_output=True, text=True,
+        timeout=timeout,
+    )
+    if result.returncode:
+        raise RuntimeError(f"importing {module} failed:\n{result.stderr}")
+    for line in result.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if name.strip() == module and not name[1:].startswith(" "):
+            return int(cumulative), result.stdout
+    raise RuntimeError(f"no import time reported for {module}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5, help="imports per module (best is kept)")
+    parser.add_argument("modules", nargs="*", default=sorted(BUDGETS))
+    args = parser.parse_args()
+
+    cache = tempfile.TemporaryDirectory()
+    env = dict(os.environ, PYTHONPYCACHEPREFIX=cache.name)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+
+    failed = []
+    print(f"{'module':<20} {'import ms':>10} {'budget ms':>10}")
+    for module in args.modules:
+        directory, budget = BUDGETS[module]
+        problem = None
+        try:
+            runs = [import_time(module, directory, env) for _ in range(args.runs + 1)][1:]
+        except subprocess.TimeoutExpired:
+            problem, best = "blocked (waiting for input?)", None
+        else:
+            best = min(us for us, _ in runs) / 1000
+            if any(output for _, output in runs):
+                problem = "prints on import"
+            elif best > budget:
+                problem = "over budget"
+        shown = f"{best:10.1f}" if best is not None else f"{'-':>10}"
+        print(f"{module:<20} {shown} {budget:>10} {problem or 'ok'}")
+        if problem:
+            failed.append(module)
+
+    cache.cleanup()
+    if failed:
+        print(f"FAILED: {', '.join(failed)}")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
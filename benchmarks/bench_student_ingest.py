@@ -0,0 +1,66 @@
+"""
+StudentManager ingestion benchmark
+
+Writes one synthetic CSV per campus and reports rows/sec for loading them
+all with StudentManager at several worker counts, plus sharded export.
+
+Run: python benchmarks/bench_student_ingest.py --campuses 8 --rows 200000
+"""
+
+import argparse
+import contextlib
+import csv
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import midterm2
+
+MAJORS = ["Computer Science", "Math", "Biology", "History", "Art", "Nursing"]
+
+
+def write_campus(filename, rows, seed):
+    rng = random.Random(seed)
+    with open(filename, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["name", "gpa", "major"])
+        for i in range(rows):
+            writer.writerow([f"student{seed}_{i}", round(rng.uniform(0, 4), 2),
+                             rng.choice(MAJORS)])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--campuses", type=int, default=8)
+    parser.add_argument("--rows", type=int, default=100000, help="rows per campus")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for campus in range(args.campuses):
+            write_campus(os.path.join(tmp, f"campus{campus}.csv"), args.rows, campus)
+        pattern = os.path.join(tmp, "campus*.csv")
+        total = args.campuses * args.rows
+
+        print(f"{'workers':>8} {'load rows/sec':>15} {'export rows/sec':>16}")
+        for workers in args.workers:
+            start = time.perf_counter()
+            manager = midterm2.StudentManager(pattern, workers=workers)
+            load_rate = total / (time.perf_counter() - start)
+            assert len(manager.students) == total
+
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                manager.export_filtered(manager.students, os.path.join(tmp, "out.csv"),
+                                        shards=max(workers, 2))
+            export_rate = total / (time.perf_counter() - start)
+            print(f"{workers:>8} {load_rate:>15,.0f} {export_rate:>16,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,419 @@
+"""
+Benchmark harness
+
+Runs the hot path of every subsystem and reports throughput, per-operation
+latency and peak memory:
+
+- game.explore          Game.explore() in silent 50-step games
+- player.inventory      Player.add_item() / remove_item()
+- students.load         StudentManager loading a CSV
+- students.filter       StudentManager.filter_by_gpa()
+- students.export       StudentManager.export_filtered()
+- students.query        streaming GPA-range + major query, grouped by major
+- madlib.generate       generate_story()
+- madlib.save           save_story() (capped at 100k files per run)
+- inventory.restock     Inventory.restock_many()
+- smart_home.update     quiet smart_home temperature/security/light updates
+
+Each case runs at every requested size (number of operations, or CSV rows
+for the student cases). Throughput is the best of --repeat timed runs; a
+timed run repeats the case until it has lasted at least --min-time
+seconds, so millisecond-long cases are not dominated by timer and
+scheduler noise. The garbage collector is run before, and disabled
+during, each timed run. Latency percentiles come from timing single
+operations, where a case has one. Peak memory is the tracemalloc peak
+during one extra run, after setup.
+
+Results can be written as JSON (--json) and compared against a stored
+baseline (--baseline). The exit status is 1 when any case is slower, or
+uses more memory, than the baseline by more than --threshold. Baselines
+are machine-specific: regenerate benchmarks/baseline.json with
+--save-baseline on the machine that runs the comparison.
+
+Run: python benchmarks/run.py                                   (10k)
+     python benchmarks/run.py --sizes 10k 1m 10m --json results.json
+     python benchmarks/run.py --baseline benchmarks/baseline.json
+"""
+
+import argparse
+import contextlib
+import csv
+import datetime
+import fnmatch
+import gc
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import namedtuple
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path[:0] = [ROOT, os.path.join(ROOT, "game"), os.path.join(ROOT, "madlib")]
+
+import digital_twin
+import madlibgenerator
+import midterm2
+from game import Game, NullSink, Player
+from simulate import CautiousPolicy
+
+SIZES = {"10k": 10_000, "100k": 100_000, "1m": 1_000_000, "10m": 10_000_000}
+MAJORS = ["Computer Science", "Math", "Biology", "History", "Art", "Nursing"]
+LATENCY_SAMPLES = 2000
+
+# setup(n, shared) -> state; run(state) -> operations done;
+# sample(state) does one operation (None: no per-operation latency)
+Case = namedtuple("Case", "name setup run sample")
+
+
+# Game
+
+def setup_explore(n, shared):
+    return {"n": n, "policy": CautiousPolicy(), "game": None}
+
+
+def run_explore(state):
+    n, policy = state["n"], state["policy"]
+    done = seed = 0
+    while done < n:
+        game = Game("Bench", policy=policy, seed=seed, sink=NullSink())
+        for _ in range(min(50, n - done)):
+            game.explore()
+        done += 50
+        seed += 1
+    return n
+
+
+def sample_explore(state):
+    game = state["game"]
+    if game is None or not game.player.is_alive():
+        game = state["game"] = Game("Sample", policy=state["policy"], seed=1, sink=NullSink())
+    game.explore()
+
+
+def setup_inventory(n, shared):
+    return {"n": n, "player": Player("Bench", NullSink()),
+            "items": [item["name"] for item in Game.LOOT]}
+
+
+def run_inventory(state):
+    player, items, n = state["player"], state["items"], state["n"]
+    for i in range(n):
+        player.add_item(items[i % len(items)])
+    for i in range(n):
+        player.remove_item(items[i % len(items)])
+    return 2 * n
+
+
+def sample_inventory(state):
+    state["player"].add_item("Gold Coin")
+    state["player"].remove_item("Gold Coin")
+
+
+# Students (the three cases share one CSV and one loaded manager per size)
+
+def student_csv(n, shared):
+    key = ("students.csv", n)
+    if key not in shared:
+        path = os.path.join(shared["tmp"], f"students_{n}.csv")
+        rng = random.Random(n)
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["name", "gpa", "major"])
+            for i in range(n):
+                writer.writerow([f"Student{i}", f"{rng.uniform(1.5, 4.0):.2f}",
+                                 rng.choice(MAJORS)])
+        shared[key] = path
+    return shared[key]
+
+
+def student_manager(n, shared):
+    key = ("manager", n)
+    if key not in shared:
+        shared[key] = midterm2.StudentManager(student_csv(n, shared), workers=1)
+    return shared[key]
+
+
+def setup_load(n, shared):
+    return {"n": n, "path": student_csv(n, shared)}
+
+
+def run_load(state):
+    manager = midterm2.StudentManager(state["path"], workers=1)
+    return len(manager.students)
+
+
+def setup_filter(n, shared):
+    return {"manager": student_manager(n, shared)}
+
+
+def run_filter(state):
+    state["manager"].filter_by_gpa(3.0)
+    return len(state["manager"].students)
+
+
+def setup_export(n, shared):
+    manager = student_manager(n, shared)
+    return {"manager": manager, "filtered": manager.filter_by_gpa(3.0),
+            "path": os.path.join(shared["tmp"], "filtered.csv")}
+
+
+def run_export(state):
+    state["manager"].export_filtered(state["filtered"], state["path"])
+    return len(state["filtered"])
+
+
+def setup_query(n, shared):
+    return {"manager": midterm2.StudentManager(student_csv(n, shared), stream=True), "n": n}
+
+
+def run_query(state):
+    query = state["manager"].query(3.0, 3.8, majors={"Math", "Computer Science"})
+    query.group_by_major()
+    return state["n"]
+
+
+# Mad Libs
+
+def word_banks(count=100):
+    return [madlibgenerator.WordBank(f"noun{i}", f"verb{i}", f"adjective{i}", f"place{i}",
+                                     f"emotion{i}", f"animal{i}", f"celebrity{i}",
+                                     f"object{i}") for i in range(count)]
+
+
+def setup_generate(n, shared):
+    return {"n": n, "banks": word_banks()}
+
+
+def run_generate(state):
+    banks, generate = state["banks"], madlibgenerator.generate_story
+    for i in range(state["n"]):
+        generate(banks[i % len(banks)])
+    return state["n"]
+
+
+def sample_generate(state):
+    madlibgenerator.generate_story(state["banks"][0])
+
+
+def setup_save(n, shared):
+    return {"n": min(n, 100_000), "story": madlibgenerator.generate_story(word_banks(1)[0]),
+            "path": os.path.join(shared["tmp"], "story.txt")}
+
+
+def run_save(state):
+    save, story, path = madlibgenerator.save_story, state["story"], state["path"]
+    for _ in range(state["n"]):
+        save(story, path)
+    return state["n"]
+
+
+def sample_save(state):
+    madlibgenerator.save_story(state["story"], state["path"])
+
+
+# Inventory
+
+def setup_restock(n, shared):
+    products = min(n, 100_000)
+    inventory = midterm2.Inventory()
+    for s in range(10):
+        supplier = midterm2.Supplier(f"Supplier{s}")
+        for p in range(s, products, 10):
+            supplier.add_product(midterm2.Product(f"Product{p}", 0))
+        inventory.add_supplier(supplier)
+    # Half the updates name the product, half pass the Product itself
+    updates = [(f"Product{p}" if p % 2 else inventory.find_product(f"Product{p}"), 1)
+               for p in range(products)]
+    return {"inventory": inventory, "updates": updates, "rounds": max(1, n // products)}
+
+
+def run_restock(state):
+    inventory, updates = state["inventory"], state["updates"]
+    for _ in range(state["rounds"]):
+        inventory.restock_many(updates)
+    return state["rounds"] * len(updates)
+
+
+def sample_restock(state):
+    state["inventory"].restock_many(state["updates"][:1])
+
+
+# Smart home
+
+def setup_smart_home(n, shared):
+    homes = [digital_twin.smart_home(70, False, False, verbose=False)
+             for _ in range(min(n, 100_000))]
+    return {"n": n, "homes": homes}
+
+
+def run_smart_home(state):
+    homes, n = state["homes"], state["n"]
+    count = len(homes)
+    for i in range(n):
+        home = homes[i % count]
+        step = i % 3
+        if step == 0:
+            home.set_temperature(60 + i % 20)
+        elif step == 1:
+            home.toggle_security()
+        else:
+            home.toggle_lights()
+    return n
+
+
+def sample_smart_home(state):
+    state["homes"][0].set_temperature(72)
+
+
+CASES = [
+    Case("game.explore", setup_explore, run_explore, sample_explore),
+    Case("player.inventory", setup_inventory, run_inventory, sample_inventory),
+    Case("students.load", setup_load, run_load, None),
+    Case("students.filter", setup_filter, run_filter, None),
+    Case("students.export", setup_export, run_export, None),
+    Case("students.query", setup_query, run_query, None),
+    Case("madlib.generate", setup_generate, run_generate, sample_generate),
+    Case("madlib.save", setup_save, run_save, sample_save),
+    Case("inventory.restock", setup_restock, run_restock, sample_restock),
+    Case("smart_home.update", setup_smart_home, run_smart_home, sample_smart_home),
+]
+
+
+def timed_run(case, state, min_time):
+    """Run a case until at least min_time seconds pass; return (ops, seconds)."""
+    gc.collect()
+    gc.disable()
+    try:
+        ops = 0
+        start = time.perf_counter()
+        while True:
+            ops += case.run(state)
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time:
+                return ops, elapsed
+    finally:
+        gc.enable()
+
+
+def measure(case, n, shared, repeat, min_time, memory):
+    """Run one case at one size and return its result dict."""
+    state = case.setup(n, shared)
+    best = None
+    for _ in range(repeat):
+        ops, elapsed = timed_run(case, state, min_time)
+        if best is None or ops * best[1] > best[0] * elapsed:
+            best = ops, elapsed
+    ops, seconds = best
+    result = {"ops": ops, "seconds": seconds, "ops_per_sec": ops / seconds if seconds else 0.0}
+
+    if case.sample is not None:
+        clock = time.perf_counter_ns
+        samples = []
+        for _ in range(LATENCY_SAMPLES):
+            start = clock()
+            case.sample(state)
+            samples.append(clock() - start)
+        samples.sort()
+        result["p50_us"] = samples[len(samples) // 2] / 1000
+        result["p99_us"] = samples[int(len(samples) * 0.99)] / 1000
+
+    if memory:
+        state = case.setup(n, shared)
+        tracemalloc.start()
+        tracemalloc.reset_peak()
+        case.run(state)
+        result["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return result
+
+
+def compare(results, baseline, threshold):
+    """Return {key: reason} for every result that regressed against baseline."""
+    regressions = {}
+    for key, result in results.items():
+        old = baseline.get(key)
+        if old is None:
+            continue
+        if result["ops_per_sec"] < old["ops_per_sec"] * (1 - threshold):
+            regressions[key] = (f"throughput {result['ops_per_sec']:,.0f}/s vs "
+                                f"{old['ops_per_sec']:,.0f}/s")
+        elif ("peak_bytes" in result and "peak_bytes" in old
+              and result["peak_bytes"] > old["peak_bytes"] * (1 + threshold) + (1 << 20)):
+            regressions[key] = (f"peak memory {result['peak_bytes'] / 1e6:.1f} MB vs "
+                                f"{old['peak_bytes'] / 1e6:.1f} MB")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", nargs="+", default=["10k"], choices=sorted(SIZES),
+                        help="operations / rows per case (default: 10k)")
+    parser.add_argument("--cases", nargs="+", default=["*"],
+                        help="case names or patterns, e.g. students.* (default: all)")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case (best kept)")
+    parser.add_argument("--min-time", type=float, default=0.3,
+                        help="minimum seconds per timed run (default: 0.3)")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc run")
+    parser.add_argument("--json", metavar="FILE", help="write results as JSON")
+    parser.add_argument("--baseline", metavar="FILE", help="compare against this JSON")
+    parser.add_argument("--save-baseline", metavar="FILE", help="write results as a new baseline")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed slowdown / memory growth (default: 0.25)")
+    args = parser.parse_args()
+
+    cases = [case for case in CASES
+             if any(fnmatch.fnmatchcase(case.name, pattern) for pattern in args.cases)]
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+
+    results = {}
+    print(f"{'case':<20} {'size':>5} {'ops/s':>13} {'p50 us':>9} {'p99 us':>9} "
+          f"{'peak MB':>9} {'vs base':>8}")
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, "w") as devnull:
+        for size in args.sizes:
+            shared = {"tmp": tmp}
+            for case in cases:
+                with contextlib.redirect_stdout(devnull):
+                    result = measure(case, SIZES[size], shared, args.repeat, args.min_time,
+                                     not args.no_memory)
+                key = f"{case.name}@{size}"
+                results[key] = result
+                old = baseline.get(key)
+                change = (f"{result['ops_per_sec'] / old['ops_per_sec'] - 1:+8.0%}"
+                          if old else f"{'-':>8}")
+                p50 = f"{result['p50_us']:9.1f}" if "p50_us" in result else f"{'-':>9}"
+                p99 = f"{result['p99_us']:9.1f}" if "p99_us" in result else f"{'-':>9}"
+                peak = (f"{result['peak_bytes'] / 1e6:9.1f}" if "peak_bytes" in result
+                        else f"{'-':>9}")
+                print(f"{case.name:<20} {size:>5} {result['ops_per_sec']:13,.0f} "
+                      f"{p50} {p99} {peak} {change}", flush=True)
+
+    report = {
+        "meta": {
+            "date": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+            "min_time": args.min_time,
+        },
+        "results": results,
+    }
+    for filename in (args.json, args.save_baseline):
+        if filename:
+            with open(filename, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+
+    regressions = compare(results, baseline, args.threshold)
+    for key, reason in regressions.items():
+        print(f"REGRESSION {key}: {reason}")
+    raise SystemExit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,7 @@
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+
 class Car:
     def __init__(self, make, model, year):
         self._make = make
@@ -45,14 +49,253 @@ class gasCar(Car):
     def refuel(self):
         print(f"Refueling the {self.fuel_type} tank.")
 
+# Slotted versions of the classes above: same behavior, no per-instance
+# __dict__. Methods that don't use super() are shared with the originals.
+class SlottedCar:
+    __slots__ = ("_make", "_model", "_Car__year")  # Car's private __year
+
+    __init__ = Car.__init__
+    get_description = Car.get_description
+    start_engine = Car.start_engine
+    get_year = Car.get_year
+    set_year = Car.set_year
+
+class SlottedECar(SlottedCar):
+    __slots__ = ("battery_size",)
+
+    def __init__(self, make, model, year, battery_size):
+        super().__init__(make, model, year)
+        self.battery_size = battery_size
+
+    def get_description(self):
+        base_desc = super().get_description()
+        return f"{base_desc} with a {self.battery_size}-kWh battery"
+
+    start_engine = eCar.start_engine
+    charge_battery = eCar.charge_battery
+
+class SlottedGasCar(SlottedCar):
+    __slots__ = ("fuel_type",)
+
+    def __init__(self, make, model, year, fuel_type):
+        super().__init__(make, model, year)
+        self.fuel_type = fuel_type
+
+    start_engine = gasCar.start_engine
+    refuel = gasCar.refuel
+
+# Columnar registry for very large fleets. Each vehicle is a row number;
+# make/model/fuel type are interned strings stored as codes, year and
+# battery size live in typed arrays. Rows can be looked up by make, year
+# range and powertrain, and descriptions are rendered in bulk and cached
+# until the row's year changes.
+GAS, ELECTRIC, PLAIN = "gas", "electric", "plain"
+POWERTRAINS = (PLAIN, ELECTRIC, GAS)
+
+class FleetRegistry:
+    def __init__(self):
+        self.makes = []          # code -> interned make
+        self.models = []         # code -> interned model
+        self.fuel_types = [""]   # code -> interned fuel type (0 = none)
+        self._codes = ({}, {}, {"": 0})  # make, model, fuel -> code
+        self.make_codes = array('I')
+        self.model_codes = array('I')
+        self.years = array('i')
+        self.powertrains = array('B')  # index into POWERTRAINS
+        self.battery_sizes = array('d')  # 0 unless electric
+        self.battery_is_int = array('B')  # 1 if the battery size was an int
+        self.fuel_codes = array('H')
+        # Indexes
+        self._by_make = {}  # make code -> array of rows
+        self._by_powertrain = [array('I') for _ in POWERTRAINS]
+        self._year_order = None  # rows sorted by year, rebuilt on demand
+        self._sorted_years = None
+        # Memoized descriptions (None = not rendered yet)
+        self._descriptions = []
+
+    def __len__(self):
+        return len(self.years)
+
+    def _code(self, kind, table, text):
+        codes = self._codes[kind]
+        code = codes.get(text)
+        if code is None:
+            code = codes[text] = len(table)
+            table.append(sys.intern(text))
+        return code
+
+    def add_vehicle(self, make, model, year, battery_size=None, fuel_type=None):
+        # Returns the new row number
+        if battery_size is not None:
+            powertrain = ELECTRIC
+        elif fuel_type is not None:
+            powertrain = GAS
+        else:
+            powertrain = PLAIN
+        row = len(self.years)
+        make_code = self._code(0, self.makes, make)
+        self.make_codes.append(make_code)
+        self.model_codes.append(self._code(1, self.models, model))
+        self.years.append(year)
+        self.powertrains.append(POWERTRAINS.index(powertrain))
+        self.battery_sizes.append(battery_size or 0)
+        self.battery_is_int.append(isinstance(battery_size, int))
+        self.fuel_codes.append(self._code(2, self.fuel_types, fuel_type or ""))
+        self._by_make.setdefault(make_code, array('I')).append(row)
+        self._by_powertrain[POWERTRAINS.index(powertrain)].append(row)
+        self._descriptions.append(None)
+        self._year_order = None
+        return row
+
+    def add(self, car):
+        # Add a Car/eCar/gasCar (or slotted variant)
+        return self.add_vehicle(car._make, car._model, car.get_year(),
+                                getattr(car, "battery_size", None),
+                                getattr(car, "fuel_type", None))
+
+    @classmethod
+    def from_cars(cls, cars):
+        registry = cls()
+        for car in cars:
+            registry.add(car)
+        return registry
+
+    def car(self, row):
+        # Rebuild the object for one row
+        make = self.makes[self.make_codes[row]]
+        model = self.models[self.model_codes[row]]
+        year = self.years[row]
+        powertrain = POWERTRAINS[self.powertrains[row]]
+        if powertrain == ELECTRIC:
+            return eCar(make, model, year, self._battery(row))
+        if powertrain == GAS:
+            return gasCar(make, model, year, self.fuel_types[self.fuel_codes[row]])
+        return Car(make, model, year)
+
+    def _battery(self, row):
+        # The battery size as given: int or float
+        battery = self.battery_sizes[row]
+        return int(battery) if self.battery_is_int[row] else battery
+
+    def get_year(self, row):
+        return self.years[row]
+
+    def set_year(self, row, year):
+        # Same rule as Car.set_year; drops the cached description and year index
+        if year > 1885:
+            self.years[row] = year
+            self._descriptions[row] = None
+            self._year_order = None
+        else:
+            print("Please enter a valid year.")
+
+    # Queries: each returns a list of row numbers in row order
+    def by_make(self, make):
+        code = self._codes[0].get(make)
+        return list(self._by_make.get(code, ()))
+
+    def by_powertrain(self, powertrain):
+        if powertrain not in POWERTRAINS:
+            print(f"Error: unknown powertrain {powertrain!r}")
+            return []
+        return list(self._by_powertrain[POWERTRAINS.index(powertrain)])
+
+    def by_year(self, year_min=None, year_max=None):
+        if self._year_order is None:
+            order = sorted(range(len(self.years)), key=self.years.__getitem__)
+            self._year_order = array('I', order)
+            self._sorted_years = array('i', [self.years[row] for row in order])
+        low = 0 if year_min is None else bisect_left(self._sorted_years, year_min)
+        high = (len(self._sorted_years) if year_max is None
+                else bisect_right(self._sorted_years, year_max))
+        return sorted(self._year_order[low:high])
+
+    def query(self, make=None, year_min=None, year_max=None, powertrain=None):
+        # Start from the narrowest index and check the other conditions on
+        # the columns directly
+        if powertrain is not None and powertrain not in POWERTRAINS:
+            print(f"Error: unknown powertrain {powertrain!r}")
+            return []
+        candidates = []
+        if make is not None:
+            candidates.append(self.by_make(make))
+        if powertrain is not None:
+            candidates.append(self.by_powertrain(powertrain))
+        if not candidates:
+            return self.by_year(year_min, year_max)
+        rows = min(candidates, key=len)
+        if make is not None:
+            code = self._codes[0].get(make, -1)
+            rows = [row for row in rows if self.make_codes[row] == code]
+        if powertrain is not None:
+            code = POWERTRAINS.index(powertrain)
+            rows = [row for row in rows if self.powertrains[row] == code]
+        if year_min is not None or year_max is not None:
+            low = float('-inf') if year_min is None else year_min
+            high = float('inf') if year_max is None else year_max
+            years = self.years
+            rows = [row for row in rows if low <= years[row] <= high]
+        return rows
+
+    def describe(self, row):
+        description = self._descriptions[row]
+        if description is None:
+            description = self.describe_all([row])[0]
+        return description
+
+    def describe_all(self, rows=None):
+        # Render every missing description in one pass (same text as
+        # get_description) and return them for `rows` (default: all)
+        cache = self._descriptions
+        makes, models = self.makes, self.models
+        make_codes, model_codes = self.make_codes, self.model_codes
+        years, powertrains = self.years, self.powertrains
+        electric = POWERTRAINS.index(ELECTRIC)
+        if rows is None:
+            rows = range(len(years))
+        result = []
+        for row in rows:
+            description = cache[row]
+            if description is None:
+                description = f"{years[row]} {makes[make_codes[row]]} {models[model_codes[row]]}"
+                if powertrains[row] == electric:
+                    description += f" with a {self._battery(row)}-kWh battery"
+                cache[row] = description
+            result.append(description)
+        return result
+
+    def start_all(self, rows=None):
+        # Bulk start_car: build every message, then print once
+        makes, make_codes = self.makes, self.make_codes
+        fuel_types, fuel_codes = self.fuel_types, self.fuel_codes
+        powertrains = self.powertrains
+        electric, gas = POWERTRAINS.index(ELECTRIC), POWERTRAINS.index(GAS)
+        if rows is None:
+            rows = range(len(self.years))
+        lines = []
+        for row in rows:
+            make = makes[make_codes[row]]
+            if powertrains[row] == electric:
+                lines.append(f"{make} electric engine started silently.")
+            elif powertrains[row] == gas:
+                lines.append(f"{make} {fuel_types[fuel_codes[row]]} engine started with a roar.")
+            else:
+                lines.append(f"{make} engine started.")
+        if lines:
+            print("\n".join(lines))
+
 def start_car(car: Car):
     car.start_engine()
 
-tesla = eCar("Tesla", "Model S", 2020, 100)
-mustang = gasCar("Ford", "Mustang", 1967, "gasoline")
+def main():
+    tesla = eCar("Tesla", "Model S", 2020, 100)
+    mustang = gasCar("Ford", "Mustang", 1967, "gasoline")
+
+    start_car(tesla) # Can also do tesla.start_car()
+    start_car(mustang)
 
-start_car(tesla) # Can also do tesla.start_car()
-start_car(mustang)
+    print(tesla.get_description())
+    print(mustang.get_description())
 
-print(tesla.get_description())
-print(mustang.get_description())
+if __name__ == "__main__":
+    main()
@@ -1,25 +1,222 @@
+import operator
+import time
+from array import array
+from itertools import accumulate
+
 class smart_home:
-    def __init__(self, temperature, security_status, lights_status):
+    # telemetry: optional home_telemetry that records every state change
+    # verbose=False skips the print on each change (for bulk simulations)
+    # at: timestamp of the initial state (default: now); pass the start of
+    # a simulated timeline so later changes with at= can follow it
+    def __init__(self, temperature, security_status, lights_status,
+                 telemetry=None, verbose=True, at=None):
         self.temperature = temperature
         self.security_status = security_status
         self.lights_status = lights_status
-    
-    def set_temperature(self, temperature):
+        self.telemetry = telemetry
+        self.verbose = verbose
+        if telemetry is not None:
+            telemetry.record_state(self, time.time() if at is None else at)
+
+    # Each change is recorded before the state is updated, so a rejected
+    # timestamp leaves both the home and its telemetry unchanged
+    def set_temperature(self, temperature, at=None):
+        if self.telemetry is not None:
+            self.telemetry.temperature.append(time.time() if at is None else at, temperature)
         self.temperature = temperature
-        print(f"Temperature set to {self.temperature}°F")
+        if self.verbose:
+            print(f"Temperature set to {self.temperature}°F")
 
-    def toggle_security(self):
+    def toggle_security(self, at=None):
+        if self.telemetry is not None:
+            self.telemetry.security.append(time.time() if at is None else at,
+                                           not self.security_status)
         self.security_status = not self.security_status
-        status = "armed" if self.security_status else "disarmed"
-        print(f"Security system is now {status}")   
+        if self.verbose:
+            status = "armed" if self.security_status else "disarmed"
+            print(f"Security system is now {status}")
 
-    def toggle_lights(self):
+    def toggle_lights(self, at=None):
+        if self.telemetry is not None:
+            self.telemetry.lights.append(time.time() if at is None else at,
+                                         not self.lights_status)
         self.lights_status = not self.lights_status
-        status = "on" if self.lights_status else "off"
-        print(f"Lights are now {status}")
+        if self.verbose:
+            status = "on" if self.lights_status else "off"
+            print(f"Lights are now {status}")
+
+# Same as smart_home but with __slots__ instead of a per-instance __dict__
+class slotted_smart_home:
+    __slots__ = ("temperature", "security_status", "lights_status",
+                 "telemetry", "verbose")
+
+    __init__ = smart_home.__init__
+    set_temperature = smart_home.set_temperature
+    toggle_security = smart_home.toggle_security
+    toggle_lights = smart_home.toggle_lights
+
+class telemetry_channel:
+    # Append-only ring buffer of (timestamp, value) state changes. A value
+    # holds until the next change, so the channel is a step function over
+    # time. Each slot also stores the running integral of that function up
+    # to its timestamp, which turns any windowed integral or mean into two
+    # binary searches. Once full, the oldest samples are overwritten.
+    # The arrays start empty and grow up to capacity, so a channel that
+    # records a few changes a day stays small.
+    def __init__(self, capacity=86400):
+        self.capacity = capacity
+        self.times = array('d')
+        self.values = array('d')
+        self.integrals = array('d')
+        self.count = 0  # samples ever appended
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    def _next_integral(self, at):
+        # Running integral up to `at`, continuing from the newest sample
+        if not self.count:
+            return 0.0
+        last = (self.count - 1) % self.capacity
+        elapsed = at - self.times[last]
+        if elapsed < 0:
+            raise ValueError("telemetry timestamps must not go backwards")
+        return self.integrals[last] + self.values[last] * elapsed
+
+    def append(self, at, value):
+        value = float(value)
+        integral = self._next_integral(at)
+        count = self.count
+        if count < self.capacity:
+            self.times.append(at)
+            self.values.append(value)
+            self.integrals.append(integral)
+        else:
+            slot = count % self.capacity
+            self.times[slot] = at
+            self.values[slot] = value
+            self.integrals[slot] = integral
+        self.count = count + 1
+
+    def extend(self, times, values):
+        # Bulk append: the running integrals are computed with accumulate()
+        # and the samples are slice-assigned into the ring. Same result as
+        # append() per sample; extra items in the longer input are ignored.
+        times = times if isinstance(times, array) and times.typecode == 'd' else array('d', times)
+        values = array('d', values)
+        n = min(len(times), len(values))
+        if not n:
+            return
+        if len(times) != n:
+            times = times[:n]
+        if len(values) != n:
+            values = values[:n]
+        if not all(map(operator.le, times, times[1:])):
+            raise ValueError("telemetry timestamps must not go backwards")
+        steps = map(operator.mul, values, map(operator.sub, times[1:], times))
+        integrals = array('d', accumulate(steps, initial=self._next_integral(times[0])))
+        capacity = self.capacity
+        if n > capacity:
+            # Only the newest `capacity` samples survive
+            times, values, integrals = times[-capacity:], values[-capacity:], integrals[-capacity:]
+        count = self.count
+        kept = len(times)
+        if count + n <= capacity:
+            self.times.extend(times)
+            self.values.extend(values)
+            self.integrals.extend(integrals)
+        else:
+            start = (count + n - kept) % capacity
+            first = min(kept, capacity - start)
+            for column, data in ((self.times, times), (self.values, values),
+                                 (self.integrals, integrals)):
+                if len(column) < capacity:
+                    column.frombytes(bytes(8 * (capacity - len(column))))
+                column[start:start + first] = data[:first]
+                column[:kept - first] = data[first:]
+        self.count = count + n
+
+    def latest(self):
+        if not self.count:
+            return None
+        return self.values[(self.count - 1) % self.capacity]
+
+    def _find(self, at):
+        # Last retained sample with timestamp <= at (as a ring slot), or None
+        lo, hi = self.count - len(self), self.count
+        times, capacity = self.times, self.capacity
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if times[mid % capacity] <= at:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == self.count - len(self):
+            return None
+        return (lo - 1) % self.capacity
+
+    def _integral_to(self, at):
+        slot = self._find(at)
+        if slot is None:
+            # Before the oldest retained sample
+            return self.integrals[(self.count - len(self)) % self.capacity] if self.count else 0.0
+        return self.integrals[slot] + self.values[slot] * (at - self.times[slot])
+
+    def integral(self, start, end):
+        # Area under the step function between start and end. Time before
+        # the oldest retained sample counts as zero.
+        return self._integral_to(end) - self._integral_to(start)
+
+    def mean(self, start, end):
+        # Time-weighted mean over [start, end] (None if nothing is known yet)
+        oldest = self.times[(self.count - len(self)) % self.capacity] if self.count else None
+        if oldest is None or end <= oldest:
+            return None
+        start = max(start, oldest)
+        if end <= start:
+            return None
+        return self.integral(start, end) / (end - start)
+
+class home_telemetry:
+    # Event-sourced history of one smart_home: a telemetry_channel per
+    # state. Booleans are stored as 0.0/1.0, so the integral of the lights
+    # channel is the time the lights were on.
+    def __init__(self, capacity=86400):
+        self.temperature = telemetry_channel(capacity)
+        self.security = telemetry_channel(capacity)
+        self.lights = telemetry_channel(capacity)
+
+    def record_state(self, home, at):
+        self.temperature.append(at, home.temperature)
+        self.security.append(at, home.security_status)
+        self.lights.append(at, home.lights_status)
+
+    def mean_temperature(self, start, end):
+        return self.temperature.mean(start, end)
+
+    def lights_on_time(self, start, end):
+        return self.lights.integral(start, end)
+
+    def security_armed_time(self, start, end):
+        return self.security.integral(start, end)
+
+    def replay(self, times, temperatures=None, security=None, lights=None):
+        # Bulk-load recorded sensor readings straight into the channels,
+        # skipping smart_home and its prints entirely
+        times = array('d', times)
+        if temperatures is not None:
+            self.temperature.extend(times, temperatures)
+        if security is not None:
+            self.security.extend(times, security)
+        if lights is not None:
+            self.lights.extend(times, lights)
 
 # Example usage
-home = smart_home(22, False, False)
-home.set_temperature(70)
-home.toggle_security()
-home.toggle_lights()
+def main():
+    home = smart_home(22, False, False)
+    home.set_temperature(70)
+    home.toggle_security()
+    home.toggle_lights()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+import asyncio
+import time
+from array import array
+
+from digital_twin import smart_home
+
+# Asyncio controller for a fleet of smart_home twins. Commands are queued
+# with submit() (no await, no per-command task) and a single apply loop
+# drains the queue in batches: each batch is grouped by the attribute the
+# commands change and applied attribute by attribute. Commands on the same
+# attribute (e.g. set_lights then toggle_lights) keep their submission
+# order, since they don't commute. A command that fails is counted in
+# `failed` and does not stop the loop. Homes should be built with
+# verbose=False so that applying a command does not print.
+
+COMMANDS = ("set_temperature", "toggle_security", "toggle_lights",
+            "set_security", "set_lights")
+
+# command -> attribute it changes
+ATTRIBUTES = {
+    "set_temperature": "temperature",
+    "toggle_security": "security",
+    "set_security": "security",
+    "toggle_lights": "lights",
+    "set_lights": "lights",
+}
+
+class FleetController:
+    def __init__(self, homes, batch_size=4096, latency_samples=100000):
+        self.homes = homes  # list (or dict) of smart_home, indexed by home id
+        self.batch_size = batch_size
+        self._pending = []  # (command, home_id, value, submitted_at)
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._task = None
+        # Counters
+        self.submitted = 0
+        self.applied = 0
+        self.failed = 0
+        self.last_error = None  # message for the most recent failed command
+        self.batches = 0
+        self.started_at = None
+        # Ring of the most recent apply latencies (seconds)
+        self._latencies = array('d', bytes(8 * latency_samples))
+        self._latency_count = 0
+
+    def start(self):
+        self.started_at = time.perf_counter()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        return self._task
+
+    async def stop(self):
+        await self.drain()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def submit(self, home_id, command, value=None):
+        if command not in COMMANDS:
+            raise ValueError(f"Unknown command: {command}")
+        homes = self.homes
+        if isinstance(homes, dict):
+            known = home_id in homes
+        else:
+            known = isinstance(home_id, int) and 0 <= home_id < len(homes)
+        if not known:
+            raise ValueError(f"Unknown home: {home_id!r}")
+        if command == "set_temperature" and (
+                isinstance(value, bool) or not isinstance(value, (int, float))):
+            raise ValueError(f"set_temperature needs a number, not {value!r}")
+        self._pending.append((command, home_id, value, time.perf_counter()))
+        self.submitted += 1
+        self._idle.clear()
+        self._wakeup.set()
+
+    def schedule(self, delay, home_id, command, value=None):
+        # Submit a command after `delay` seconds, e.g. a light schedule
+        loop = asyncio.get_running_loop()
+        return loop.call_later(delay, self.submit, home_id, command, value)
+
+    async def drain(self):
+        # Wait until everything submitted so far has been applied
+        await self._idle.wait()
+
+    async def _run(self):
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            try:
+                while self._pending:
+                    pending, self._pending = self._pending, []
+                    for start in range(0, len(pending), self.batch_size):
+                        self._apply(pending[start:start + self.batch_size])
+                        # Let producers run between batches
+                        await asyncio.sleep(0)
+            finally:
+                # Even if the loop is cancelled, drain() must not hang
+                if not self._pending:
+                    self._idle.set()
+
+    def _apply(self, batch):
+        groups = {}
+        for item in batch:
+            groups.setdefault(ATTRIBUTES[item[0]], []).append(item)
+        homes = self.homes
+        now = time.time()
+        failed = 0
+        for attribute, items in groups.items():
+            for command, home_id, value, _ in items:
+                try:
+                    home = homes[home_id]
+                    if attribute == "temperature":
+                        home.set_temperature(value, at=now)
+                    elif attribute == "security":
+                        if command == "toggle_security" or home.security_status != bool(value):
+                            home.toggle_security(at=now)
+                    elif command == "toggle_lights" or home.lights_status != bool(value):
+                        home.toggle_lights(at=now)
+                except Exception as e:
+                    failed += 1
+                    self.last_error = f"{command} on home {home_id!r}: {e}"
+        done = time.perf_counter()
+        latencies, size = self._latencies, len(self._latencies)
+        count = self._latency_count
+        for item in batch:
+            latencies[count % size] = done - item[3]
+            count += 1
+        self._latency_count = count
+        self.applied += len(batch) - failed
+        self.failed += failed
+        self.batches += 1
+
+    def latency_percentile(self, percent):
+        kept = min(self._latency_count, len(self._latencies))
+        if not kept:
+            return None
+        ordered = sorted(self._latencies[:kept])
+        return ordered[min(kept - 1, int(kept * percent / 100))]
+
+    def stats(self):
+        elapsed = time.perf_counter() - self.started_at if self.started_at else 0.0
+        return {
+            "submitted": self.submitted,
+            "applied": self.applied,
+            "failed": self.failed,
+            "pending": len(self._pending),
+            "batches": self.batches,
+            "commands_per_sec": self.applied / elapsed if elapsed else 0.0,
+            "p50_latency_ms": (self.latency_percentile(50) or 0.0) * 1000,
+            "p99_latency_ms": (self.latency_percentile(99) or 0.0) * 1000,
+        }
+
+def make_fleet(count, temperature=70):
+    return [smart_home(temperature, False, False, verbose=False) for _ in range(count)]
@@ -9,69 +9,424 @@ A simple text adventure game with:
 
 Run: python game.py
 Commands: explore, status, inventory, help, quit
+Profile a headless batch: python game.py --profile game.pstats --sessions 1000
 """
 
 import random
+import sys
+
+
+class ConsoleSink:
+    """Print every message to the console (the default sink)."""
+    
+    def emit(self, event, message, **fields):
+        """Format and print one message.
+        
+        event: short event name (e.g. "damage"), used by structured sinks.
+        message: str.format template, only formatted if the sink needs text.
+        fields: values for the template.
+        """
+        print(message.format(**fields) if fields else message)
+
+
+class NullSink:
+    """Discard every message without formatting it."""
+    
+    def emit(self, event, message, **fields):
+        pass
+
+
+class BufferedSink:
+    """Collect formatted messages and write them out in one go.
+    
+    Lines are written to `stream` (default: sys.stdout) every `limit`
+    messages and on flush(). With limit=0 nothing is written until flush(),
+    and drain() hands the buffered text to the caller instead.
+    """
+    
+    def __init__(self, stream=None, limit=1000):
+        self.stream = stream
+        self.limit = limit
+        self.lines = []
+    
+    def emit(self, event, message, **fields):
+        self.lines.append(message.format(**fields) if fields else message)
+        if self.limit and len(self.lines) >= self.limit:
+            self.flush()
+    
+    def drain(self):
+        """Return buffered text and clear the buffer."""
+        text = "".join(line + "\n" for line in self.lines)
+        self.lines = []
+        return text
+    
+    def flush(self):
+        """Write buffered text to the stream."""
+        if self.lines:
+            stream = sys.stdout if self.stream is None else self.stream
+            stream.write(self.drain())
+            stream.flush()
+
+
+class EventSink:
+    """Keep (event, fields) pairs as structured data; no text is built."""
+    
+    def __init__(self):
+        self.events = []
+    
+    def emit(self, event, message, **fields):
+        self.events.append((event, fields))
+
+
+CONSOLE = ConsoleSink()
+
+
+class Inventory:
+    """Counted inventory: item -> quantity, with O(1) add and remove.
+    
+    Behaves like the list it replaces (append, remove, in, len, iteration,
+    indexing), except that iteration yields copies of the same item
+    together, in the order each item was first added. The display string
+    is cached and rebuilt only after the inventory changes.
+    """
+    
+    __slots__ = ("_counts", "_size", "_display")
+    
+    def __init__(self, items=()):
+        self._counts = {}
+        self._size = 0
+        self._display = None
+        for item in items:
+            self.append(item)
+    
+    def append(self, item, quantity=1):
+        """Add `quantity` copies of item."""
+        self._counts[item] = self._counts.get(item, 0) + quantity
+        self._size += quantity
+        self._display = None
+    
+    def remove(self, item):
+        """Remove one copy of item (ValueError if there is none, like list)."""
+        count = self._counts.get(item)
+        if not count:
+            raise ValueError(f"{item!r} not in inventory")
+        if count == 1:
+            del self._counts[item]
+        else:
+            self._counts[item] = count - 1
+        self._size -= 1
+        self._display = None
+    
+    def count(self, item):
+        """How many copies of item are held."""
+        return self._counts.get(item, 0)
+    
+    def items(self):
+        """(item, quantity) pairs in first-added order."""
+        return self._counts.items()
+    
+    def display(self):
+        """Comma-separated summary, e.g. "Gold Coin x3, Magic Potion"."""
+        if self._display is None:
+            self._display = ", ".join(
+                f"{item} x{count}" if count > 1 else item
+                for item, count in self._counts.items()
+            )
+        return self._display
+    
+    def __contains__(self, item):
+        return item in self._counts
+    
+    def __len__(self):
+        return self._size
+    
+    def __iter__(self):
+        for item, count in self._counts.items():
+            for _ in range(count):
+                yield item
+    
+    def __getitem__(self, index):
+        return list(self)[index]
+    
+    def __eq__(self, other):
+        if isinstance(other, Inventory):
+            return self._counts == other._counts
+        if isinstance(other, (list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+    
+    def __repr__(self):
+        return f"Inventory({self._counts!r})"
 
 
 class Player:
     """Represents the game player with inventory, health, and score."""
     
-    def __init__(self, name):
-        """Initialize player with starting stats."""
+    def __init__(self, name, sink=None):
+        """Initialize player with starting stats.
+        
+        sink: where messages go (default: CONSOLE).
+        """
         self.name = name
+        self.sink = CONSOLE if sink is None else sink
         self.health = 100
         self.max_health = 100
         self.score = 0
-        self.inventory = []
+        self.inventory = Inventory()
         self.location = "Starting Village"
+        self.log = None  # optional replay.EventLog
     
     def add_item(self, item):
         """Add item to inventory."""
         self.inventory.append(item)
-        print(f"✓ Added {item}!")
+        if self.log is not None:
+            self.log.item_added(item)
+        self.sink.emit("item_added", "✓ Added {item}!", item=item)
     
     def remove_item(self, item):
         """Remove item from inventory."""
         if item in self.inventory:
             self.inventory.remove(item)
+            if self.log is not None:
+                self.log.item_removed(item)
             return True
         return False
     
     def take_damage(self, damage):
         """Reduce health by damage amount."""
         self.health = max(0, self.health - damage)
-        print(f"💔 Took {damage} damage! Health: {self.health}/{self.max_health}")
+        if self.log is not None:
+            self.log.damage(damage)
+        self.sink.emit("damage", "💔 Took {damage} damage! Health: {health}/{max_health}",
+                       damage=damage, health=self.health, max_health=self.max_health)
     
     def heal(self, amount):
         """Increase health by amount."""
         self.health = min(self.max_health, self.health + amount)
-        print(f"💚 Healed {amount}! Health: {self.health}/{self.max_health}")
+        if self.log is not None:
+            self.log.heal(amount)
+        self.sink.emit("heal", "💚 Healed {amount}! Health: {health}/{max_health}",
+                       amount=amount, health=self.health, max_health=self.max_health)
     
     def add_score(self, points):
         """Add points to score (can be negative)."""
         self.score += points
-        sign = "+" if points > 0 else ""
-        print(f"⭐ {sign}{points} points! Total: {self.score}")
+        if self.log is not None:
+            self.log.score(points)
+        self.sink.emit("score", "⭐ {sign}{points} points! Total: {score}",
+                       sign="+" if points > 0 else "", points=points, score=self.score)
     
     def show_status(self):
         """Display player stats."""
         bar = '█' * (self.health // 10) + '░' * (10 - self.health // 10)
-        print(f"\n{'='*40}")
-        print(f"📊 {self.name}'s Status")
-        print(f"{'='*40}")
-        print(f"Location: {self.location}")
-        print(f"Health: {self.health}/{self.max_health} {bar}")
-        print(f"Score: {self.score}")
-        items = ", ".join(self.inventory) if self.inventory else "Empty"
-        print(f"Inventory: {items}")
-        print(f"{'='*40}\n")
+        items = self.inventory.display() or "Empty"
+        self.sink.emit(
+            "status",
+            "\n{rule}\n📊 {name}'s Status\n{rule}\nLocation: {location}\n"
+            "Health: {health}/{max_health} {bar}\nScore: {score}\n"
+            "Inventory: {items}\n{rule}\n",
+            rule="=" * 40, name=self.name, location=self.location, health=self.health,
+            max_health=self.max_health, bar=bar, score=self.score, items=items,
+        )
     
     def is_alive(self):
         """Check if player is alive."""
         return self.health > 0
 
 
+class SlottedPlayer:
+    """Player with __slots__ instead of a per-instance __dict__.
+    
+    Behaves exactly like Player (it shares Player's methods) but uses far
+    less memory when millions are alive at once.
+    """
+    
+    __slots__ = ("name", "sink", "health", "max_health", "score", "inventory", "location",
+                 "log")
+    
+    __init__ = Player.__init__
+    add_item = Player.add_item
+    remove_item = Player.remove_item
+    take_damage = Player.take_damage
+    heal = Player.heal
+    add_score = Player.add_score
+    show_status = Player.show_status
+    is_alive = Player.is_alive
+
+
+class AliasTable:
+    """Weighted random choice with O(1) draws (Walker's alias method).
+    
+    Building the table is O(n) and happens once; each draw is one random
+    number however many entries there are. Without weights the table is
+    uniform and draws exactly like rng.choice(values) would, so seeded
+    games keep their results.
+    """
+    
+    __slots__ = ("values", "weights", "prob", "alias", "uniform")
+    
+    def __init__(self, values, weights=None):
+        """values: sequence to draw from; weights: matching non-negative numbers."""
+        self.values = list(values)
+        n = len(self.values)
+        if not n:
+            raise ValueError("AliasTable needs at least one value")
+        if weights is not None:
+            weights = list(weights)
+            if len(weights) != n:
+                raise ValueError("weights must match values")
+            if sum(weights) <= 0 or min(weights) < 0:
+                raise ValueError("weights must be non-negative with a positive total")
+        # Equal weights draw exactly like no weights
+        self.uniform = weights is None or len(set(weights)) == 1
+        if self.uniform:
+            self.weights = [1.0] * n
+            self.prob = [1.0] * n
+            self.alias = list(range(n))
+            return
+        total = float(sum(weights))
+        self.weights = [w / total for w in weights]
+        
+        # Split slots into under- and over-full, then top up each small
+        # slot from a large one
+        scaled = [w * n for w in self.weights]
+        self.prob = [1.0] * n
+        self.alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+    
+    def __len__(self):
+        return len(self.values)
+    
+    def index(self, rng):
+        """Draw one index using rng (a random.Random)."""
+        if self.uniform:
+            return rng.randrange(len(self.values))
+        u = rng.random() * len(self.values)
+        i = int(u)
+        return i if u - i < self.prob[i] else self.alias[i]
+    
+    def sample(self, rng):
+        """Draw one value."""
+        return self.values[self.index(rng)]
+    
+    def sample_many(self, rng, k):
+        """Draw k values at once."""
+        values, prob, alias, n = self.values, self.prob, self.alias, len(self.values)
+        if self.uniform:
+            randrange = rng.randrange
+            return [values[randrange(n)] for _ in range(k)]
+        random = rng.random
+        out = []
+        for _ in range(k):
+            u = random() * n
+            i = int(u)
+            out.append(values[i if u - i < prob[i] else alias[i]])
+        return out
+
+
+ENCOUNTER_KINDS = ("monster", "loot", "ally")
+
+
+class _LocationTables(dict):
+    """location -> AliasTable; unknown locations get the uniform default."""
+    
+    def __init__(self, default):
+        super().__init__()
+        self.default = default
+    
+    def __missing__(self, location):
+        return self.default
+
+
+class EncounterTables:
+    """Precompiled AliasTables for one set of Game data.
+    
+    locations: a location -> description dict; monsters, loot: lists of
+    dicts with a "name". The weight arguments are all optional:
+    location_weights maps location -> weight, and encounter_weights,
+    monster_weights and loot_weights map location -> {name: weight}.
+    Anything not given is uniform, and locations without overrides share
+    one table.
+    """
+    
+    def __init__(self, locations, monsters, loot, location_weights=None,
+                 encounter_weights=None, monster_weights=None, loot_weights=None):
+        names = list(locations)
+        self._check_names(location_weights, names, "location")
+        self.locations = AliasTable(
+            names, [location_weights.get(name, 1) for name in names] if location_weights else None)
+        self.encounters = self._per_location(names, ENCOUNTER_KINDS, encounter_weights,
+                                             lambda kind: kind)
+        self.monsters = self._per_location(names, monsters, monster_weights,
+                                           lambda monster: monster["name"])
+        self.loot = self._per_location(names, loot, loot_weights, lambda item: item["name"])
+    
+    @staticmethod
+    def _check_names(weights, known, what):
+        """Raise ValueError for weight keys that name nothing (likely typos)."""
+        unknown = sorted(set(weights or ()) - set(known), key=str)
+        if unknown:
+            raise ValueError(f"Unknown {what} in weights: {', '.join(map(str, unknown))}")
+    
+    @classmethod
+    def _per_location(cls, locations, values, weights, key):
+        weights = weights or {}
+        cls._check_names(weights, locations, "location")
+        names = [key(value) for value in values]
+        tables = _LocationTables(AliasTable(values))
+        for location in locations:
+            overrides = weights.get(location)
+            cls._check_names(overrides, names, f"entry for {location}")
+            if overrides:
+                tables[location] = AliasTable(
+                    values, [overrides.get(key(value), 1) for value in values])
+            else:
+                tables[location] = tables.default
+        return tables
+    
+    def sample_many(self, rng, k):
+        """Draw k complete encounters for bulk simulation.
+        
+        Returns a list of (location, kind, entry) tuples; entry is the
+        monster or loot dict, or None for an ally.
+        """
+        encounters, monsters, loot = self.encounters, self.monsters, self.loot
+        out = []
+        for location in self.locations.sample_many(rng, k):
+            kind = encounters[location].sample(rng)
+            if kind == "monster":
+                entry = monsters[location].sample(rng)
+            elif kind == "loot":
+                entry = loot[location].sample(rng)
+            else:
+                entry = None
+            out.append((location, kind, entry))
+        return out
+
+
+HELP_TEXT = "\n".join([
+    "",
+    "=" * 40,
+    "📖 Commands",
+    "=" * 40,
+    "  explore   - Explore a random location",
+    "  status    - Show your stats",
+    "  inventory - View your items",
+    "  help      - Show this message",
+    "  quit      - Exit game",
+    "=" * 40,
+    "",
+])
+
+
 class Game:
     """Main game controller."""
     
@@ -99,27 +454,70 @@ class Game:
         {"name": "Legendary Sword", "value": 50},
     ]
     
-    def __init__(self, player_name):
-        """Initialize game with player."""
-        self.player = Player(player_name)
+    # Optional weights (see EncounterTables); empty means uniform
+    LOCATION_WEIGHTS = {}
+    ENCOUNTER_WEIGHTS = {}
+    MONSTER_WEIGHTS = {}
+    LOOT_WEIGHTS = {}
+    
+    @classmethod
+    def compile_tables(cls):
+        """Build this class's EncounterTables (call again after editing the data)."""
+        cls._tables = EncounterTables(
+            cls.LOCATIONS, cls.MONSTERS, cls.LOOT, cls.LOCATION_WEIGHTS,
+            cls.ENCOUNTER_WEIGHTS, cls.MONSTER_WEIGHTS, cls.LOOT_WEIGHTS)
+        return cls._tables
+    
+    @classmethod
+    def encounter_tables(cls):
+        """This class's EncounterTables, compiled on first use."""
+        tables = cls.__dict__.get("_tables")
+        return tables if tables is not None else cls.compile_tables()
+    
+    def __init__(self, player_name, policy=None, seed=None, log=None, sink=None):
+        """Initialize game with player.
+        
+        policy: optional object with a choose_action(game, monster) method
+        that answers "fight" or "run" instead of prompting with input().
+        Returning None defers the answer to the next handle_command() call.
+        seed: seed for this game's own random generator (None = random).
+        log: optional replay.EventLog that records everything that happens.
+        sink: where messages go (default: CONSOLE); NullSink() for silent runs.
+        """
+        self.sink = CONSOLE if sink is None else sink
+        self.player = Player(player_name, self.sink)
+        self.policy = policy
+        self.rng = random.Random(seed)
+        self.log = log
+        if log is not None:
+            log.name = player_name
+            self.player.log = log
         self.running = True
         self.commands = ["explore", "status", "inventory", "help", "quit"]
+        self.encounters = {"monster": 0, "loot": 0, "ally": 0}
+        self.pending_monster = None  # monster waiting for a deferred answer
+        self.tables = self.encounter_tables()
     
     def explore(self):
         """Handle explore command - visit a random location."""
         if not self.player.is_alive():
-            print("💀 You are defeated. Game Over!")
+            self.sink.emit("defeated", "💀 You are defeated. Game Over!")
             self.running = False
             return
         
         # Pick random location
-        location = random.choice(list(self.LOCATIONS.keys()))
+        location = self.tables.locations.sample(self.rng)
         self.player.location = location
-        print(f"\n📍 {location}")
-        print(f"{self.LOCATIONS[location]}\n")
+        if self.log is not None:
+            self.log.location(location)
+        self.sink.emit("location", "\n📍 {location}\n{description}\n",
+                       location=location, description=self.LOCATIONS[location])
         
         # Random encounter type
-        encounter = random.choice(["monster", "loot", "ally"])
+        encounter = self.tables.encounters[location].sample(self.rng)
+        self.encounters[encounter] += 1
+        if self.log is not None:
+            self.log.encounter(encounter)
         
         if encounter == "monster":
             self._fight_monster()
@@ -130,72 +528,85 @@ class Game:
     
     def _fight_monster(self):
         """Handle combat encounter."""
-        monster = random.choice(self.MONSTERS)
-        print(f"⚔️  A {monster['name']} appears!")
-        action = input("Do you [fight] or [run]? ").strip().lower()
+        monster = self.tables.monsters[self.player.location].sample(self.rng)
+        self.sink.emit("monster", "⚔️  A {monster} appears!", monster=monster["name"])
+        if self.policy is not None:
+            action = self.policy.choose_action(self, monster)
+        else:
+            action = input("Do you [fight] or [run]? ").strip().lower()
+        if action is None:
+            # Deferred: the next command answers the prompt
+            self.pending_monster = monster
+            self.sink.emit("prompt", "Do you [fight] or [run]?")
+            return
+        self._resolve_fight(monster, action)
+    
+    def _resolve_fight(self, monster, action):
+        """Apply the player's answer to a monster encounter."""
+        if self.log is not None:
+            self.log.monster(monster["name"], action)
         
         if action == "fight":
             self.player.take_damage(monster["damage"])
             self.player.add_score(monster["points"])
-            print(f"✓ Defeated the {monster['name']}!")
+            self.sink.emit("victory", "✓ Defeated the {monster}!", monster=monster["name"])
             
             # 50% chance for loot
-            if random.random() > 0.5:
-                loot = random.choice(self.LOOT)
+            if self.rng.random() > 0.5:
+                loot = self.tables.loot[self.player.location].sample(self.rng)
                 self.player.add_item(loot["name"])
                 self.player.add_score(loot["value"])
         
         elif action == "run":
-            print("You fled in panic! Lost treasure opportunity.")
+            self.sink.emit("fled", "You fled in panic! Lost treasure opportunity.")
             self.player.add_score(-10)
         
         else:
-            print("You hesitated. The creature vanished.")
+            self.sink.emit("hesitated", "You hesitated. The creature vanished.")
             self.player.add_score(-5)
-        print()
+        self.sink.emit("end", "")
     
     def _find_loot(self):
         """Handle treasure encounter."""
-        loot = random.choice(self.LOOT)
-        print(f"🎁 You found a {loot['name']}!")
+        loot = self.tables.loot[self.player.location].sample(self.rng)
+        self.sink.emit("loot", "🎁 You found a {item}!", item=loot["name"])
         self.player.add_item(loot["name"])
         self.player.add_score(loot["value"])
-        print()
+        self.sink.emit("end", "")
     
     def _meet_ally(self):
         """Handle ally encounter."""
-        print("🤝 A friendly traveler helps you!")
+        self.sink.emit("ally", "🤝 A friendly traveler helps you!")
         self.player.heal(20)
         self.player.add_score(10)
-        print()
+        self.sink.emit("end", "")
     
     def show_inventory(self):
         """Display inventory."""
-        print("\n🎒 Inventory:")
         if self.player.inventory:
-            for i, item in enumerate(self.player.inventory, 1):
-                print(f"  {i}. {item}")
+            lines = [
+                f"  {i}. {item} x{count}" if count > 1 else f"  {i}. {item}"
+                for i, (item, count) in enumerate(self.player.inventory.items(), 1)
+            ]
         else:
-            print("  (empty)")
-        print()
+            lines = ["  (empty)"]
+        self.sink.emit("inventory", "\n🎒 Inventory:\n{items}\n",
+                       items="\n".join(lines))
     
     def show_help(self):
         """Display available commands."""
-        print(f"\n{'='*40}")
-        print("📖 Commands")
-        print(f"{'='*40}")
-        print("  explore   - Explore a random location")
-        print("  status    - Show your stats")
-        print("  inventory - View your items")
-        print("  help      - Show this message")
-        print("  quit      - Exit game")
-        print(f"{'='*40}\n")
+        self.sink.emit("help", HELP_TEXT)
     
     def handle_command(self, command):
         """Process player command."""
         command = command.strip().lower()
+        if self.log is not None:
+            self.log.command(command)
         
-        if command == "explore":
+        if self.pending_monster is not None:
+            monster, self.pending_monster = self.pending_monster, None
+            self._resolve_fight(monster, command)
+        elif command == "explore":
             self.explore()
         elif command == "status":
             self.player.show_status()
@@ -204,17 +615,28 @@ class Game:
         elif command == "help":
             self.show_help()
         elif command == "quit":
-            print(f"Thanks for playing! Final Score: {self.player.score}\n")
+            self.sink.emit("quit", "Thanks for playing! Final Score: {score}\n",
+                           score=self.player.score)
             self.running = False
         else:
-            print(f"Unknown command: '{command}'. Try: {', '.join(self.commands)}\n")
+            self.sink.emit("unknown", "Unknown command: '{command}'. Try: {commands}\n",
+                           command=command, commands=", ".join(self.commands))
+    
+    def show_welcome(self):
+        """Display the welcome banner."""
+        self.sink.emit("welcome",
+                       "\n{rule}\n⚔️  Welcome, {name}!\n{rule}\n"
+                       "Your adventure begins. Type 'help' for commands.\n",
+                       rule="=" * 40, name=self.player.name)
+    
+    def show_game_over(self):
+        """Display the game over message."""
+        self.sink.emit("game_over", "\n💀 Game Over! Final Score: {score}\n",
+                       score=self.player.score)
     
     def run(self):
         """Main game loop."""
-        print(f"\n{'='*40}")
-        print(f"⚔️  Welcome, {self.player.name}!")
-        print(f"{'='*40}")
-        print("Your adventure begins. Type 'help' for commands.\n")
+        self.show_welcome()
         
         while self.running and self.player.is_alive():
             try:
@@ -222,15 +644,30 @@ class Game:
                 if cmd:
                     self.handle_command(cmd)
             except KeyboardInterrupt:
-                print("\n\nGame interrupted. Goodbye!")
+                self.sink.emit("interrupted", "\n\nGame interrupted. Goodbye!")
                 break
         
         if not self.player.is_alive():
-            print(f"\n💀 Game Over! Final Score: {self.player.score}\n")
+            self.show_game_over()
 
 
 def main():
     """Entry point."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Text adventure game.")
+    parser.add_argument("--profile", metavar="FILE",
+                        help="play a headless batch under cProfile and save pstats to FILE")
+    parser.add_argument("--handler-stats", metavar="JSON",
+                        help="play a headless batch and save per-handler timings to JSON")
+    parser.add_argument("--sessions", type=int, default=1000,
+                        help="sessions in the headless batch (default: 1000)")
+    args = parser.parse_args()
+    if args.profile or args.handler_stats:
+        from profiling import profile_batch
+        profile_batch(args.sessions, args.profile, args.handler_stats)
+        return
+    
     name = input("Enter your name, adventurer: ").strip() or "Unknown Hero"
     game = Game(name)
     game.run()
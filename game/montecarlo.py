@@ -0,0 +1,198 @@
+"""
+Vectorized Monte Carlo Estimator
+
+Plays N adventures at once with NumPy arrays instead of one Game object
+per player. Each step draws encounter types, monsters, loot and fight
+decisions for every living player in a single pass, using the same rules
+as Player/Game:
+
+- monster: fight (take damage, gain points, 50% loot drop) or run (-10)
+- loot: gain the item's value
+- ally: heal 20 (capped at max health) and gain 10
+
+Locations, encounter types, monsters and loot are drawn from the game's
+EncounterTables (including any per-location weights) with a vectorized
+alias-method sampler.
+
+Requires NumPy.
+Run: python montecarlo.py   (consistency check against simulate.py + benchmark)
+"""
+
+import time
+
+import numpy as np
+
+from game import ENCOUNTER_KINDS, Game, Player
+from simulate import POLICIES, run_sessions, summarize
+
+
+def alias_arrays(tables, locations):
+    """Stack per-location AliasTables into (prob, alias) arrays, one row each."""
+    prob = np.array([tables[location].prob for location in locations])
+    alias = np.array([tables[location].alias for location in locations], dtype=np.int64)
+    return prob, alias
+
+
+def sample_alias(rng, prob, alias, rows):
+    """Draw one index per entry of `rows` (row numbers into prob/alias)."""
+    n = prob.shape[1]
+    if (prob == 1.0).all():  # every row uniform: no alias lookups needed
+        return rng.integers(0, n, rows.size)
+    u = rng.random(rows.size) * n
+    index = u.astype(np.int64)
+    return np.where(u - index < prob[rows, index], index, alias[rows, index])
+
+
+def simulate(policy, players, seed=0, max_steps=50, tables=None):
+    """Play `players` sessions at once and return a dict of result arrays.
+
+    The policy must provide choose_fight(health, damage) over arrays.
+    tables: EncounterTables to draw from (default: Game's).
+    Arrays: score, health, survived, steps, monsters, loot, allies, items.
+    """
+    rng = np.random.default_rng(seed)
+    tables = Game.encounter_tables() if tables is None else tables
+    max_health = Player("").max_health
+    locations = tables.locations.values
+    location_prob = np.array([tables.locations.prob])
+    location_alias = np.array([tables.locations.alias], dtype=np.int64)
+    kinds = tables.encounters[locations[0]].values
+    encounter_prob, encounter_alias = alias_arrays(tables.encounters, locations)
+    encounter_code = np.array([ENCOUNTER_KINDS.index(kind) for kind in kinds])
+    monster_prob, monster_alias = alias_arrays(tables.monsters, locations)
+    monsters = tables.monsters[locations[0]].values
+    monster_damage = np.array([m["damage"] for m in monsters])
+    monster_points = np.array([m["points"] for m in monsters])
+    loot_prob, loot_alias = alias_arrays(tables.loot, locations)
+    loot_value = np.array([item["value"] for item in tables.loot[locations[0]].values])
+    # Only draw locations when some location has its own weights
+    by_location = any((prob != prob[0]).any()
+                      for prob in (encounter_prob, monster_prob, loot_prob))
+
+    health = np.full(players, max_health, dtype=np.int64)
+    score = np.zeros(players, dtype=np.int64)
+    steps = np.zeros(players, dtype=np.int64)
+    items = np.zeros(players, dtype=np.int64)
+    counts = np.zeros((3, players), dtype=np.int64)  # monster, loot, ally
+
+    for _ in range(max_steps):
+        active = np.flatnonzero(health > 0)
+        if active.size == 0:
+            break
+        steps[active] += 1
+        if by_location:
+            location = sample_alias(rng, location_prob, location_alias,
+                                    np.zeros(active.size, dtype=np.int64))
+        else:
+            location = np.zeros(active.size, dtype=np.int64)
+        encounter = encounter_code[sample_alias(rng, encounter_prob, encounter_alias, location)]
+        np.add.at(counts, (encounter, active), 1)
+
+        # Monster encounters
+        where = location[encounter == 0]
+        who = active[encounter == 0]
+        monster = sample_alias(rng, monster_prob, monster_alias, where)
+        damage = monster_damage[monster]
+        fight = np.asarray(policy.choose_fight(health[who], damage), dtype=bool)
+        fighters = who[fight]
+        health[fighters] = np.maximum(0, health[fighters] - damage[fight])
+        score[fighters] += monster_points[monster[fight]]
+        dropped = rng.random(fighters.size) > 0.5
+        drops = fighters[dropped]
+        score[drops] += loot_value[
+            sample_alias(rng, loot_prob, loot_alias, where[fight][dropped])]
+        items[drops] += 1
+        score[who[~fight]] -= 10
+
+        # Loot encounters
+        who = active[encounter == 1]
+        score[who] += loot_value[
+            sample_alias(rng, loot_prob, loot_alias, location[encounter == 1])]
+        items[who] += 1
+
+        # Ally encounters
+        who = active[encounter == 2]
+        health[who] = np.minimum(max_health, health[who] + 20)
+        score[who] += 10
+
+    return {
+        "score": score,
+        "health": health,
+        "survived": health > 0,
+        "steps": steps,
+        "monsters": counts[0],
+        "loot": counts[1],
+        "allies": counts[2],
+        "items": items,
+    }
+
+
+def summarize_arrays(results):
+    """Same keys as simulate.summarize(), computed from result arrays."""
+    return {
+        "sessions": int(results["score"].size),
+        "mean_score": float(results["score"].mean()),
+        "survival_rate": float(results["survived"].mean()),
+        "mean_steps": float(results["steps"].mean()),
+        "mean_monsters": float(results["monsters"].mean()),
+        "mean_loot": float(results["loot"].mean()),
+        "mean_allies": float(results["allies"].mean()),
+        "mean_items": float(results["items"].mean()),
+    }
+
+
+def check_consistency(policy_name="fight", scalar_sessions=5000,
+                      vector_sessions=200000, tolerance=0.05):
+    """Compare the vectorized and scalar engines; return True if they agree.
+
+    Every mean must agree within `tolerance` relative error (survival rate
+    within `tolerance` absolute).
+    """
+    policy = POLICIES[policy_name]()
+    scalar = summarize(run_sessions(policy, scalar_sessions, workers=1))
+    vector = summarize_arrays(simulate(policy, vector_sessions))
+    ok = True
+    for key in scalar:
+        if key == "sessions":
+            continue
+        if key == "survival_rate":
+            error = abs(scalar[key] - vector[key])
+        else:
+            error = abs(scalar[key] - vector[key]) / max(abs(scalar[key]), 1e-9)
+        agree = error <= tolerance
+        ok = ok and agree
+        mark = "✓" if agree else "✗"
+        print(f"  {mark} {key:>14}: scalar {scalar[key]:9.3f}  vector {vector[key]:9.3f}")
+    return ok
+
+
+def benchmark(policy_name="cautious", scalar_sessions=2000, vector_sessions=1000000):
+    """Print sessions/sec for the scalar and vectorized engines."""
+    policy = POLICIES[policy_name]()
+
+    start = time.perf_counter()
+    run_sessions(policy, scalar_sessions, workers=1)
+    scalar_rate = scalar_sessions / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    simulate(policy, vector_sessions)
+    vector_rate = vector_sessions / (time.perf_counter() - start)
+
+    print(f"  scalar: {scalar_rate:12,.0f} sessions/sec")
+    print(f"  vector: {vector_rate:12,.0f} sessions/sec")
+    print(f"  speedup: {vector_rate / scalar_rate:.0f}x")
+
+
+def main():
+    """Entry point."""
+    ok = True
+    for name in sorted(POLICIES):
+        print(f"Consistency ({name}):")
+        ok = check_consistency(name) and ok
+    print("Benchmark:")
+    benchmark()
+    raise SystemExit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Game Instrumentation and Profiling
+
+Opt-in timing for the Game handlers (explore, _fight_monster, _find_loot,
+_meet_ally, handle_command).
+
+- attach() wraps the handlers of one Game instance; games that are not
+  attached run the original methods, so disabled instrumentation costs
+  nothing
+- Per handler: call count, cumulative wall time and a latency histogram
+  with power-of-two microsecond buckets
+- Results export as JSON
+
+profile_batch() plays a headless batch in-process under cProfile and is
+what `python game.py --profile FILE` runs.
+"""
+
+import cProfile
+import json
+import pstats
+import time
+
+from game import Game, NullSink
+from simulate import CautiousPolicy
+
+
+HANDLERS = ("explore", "_fight_monster", "_find_loot", "_meet_ally", "handle_command")
+
+
+class HandlerStats:
+    """Timing totals for one handler."""
+
+    BUCKETS = 32  # bucket k holds calls taking [2**(k-1), 2**k) microseconds
+
+    def __init__(self):
+        self.calls = 0
+        self.total_ns = 0
+        self.histogram = [0] * self.BUCKETS
+
+    def add(self, elapsed_ns):
+        self.calls += 1
+        self.total_ns += elapsed_ns
+        bucket = min((elapsed_ns // 1000).bit_length(), self.BUCKETS - 1)
+        self.histogram[bucket] += 1
+
+    def to_dict(self):
+        """Counts, times in microseconds, and the non-empty histogram buckets."""
+        return {
+            "calls": self.calls,
+            "total_us": self.total_ns / 1000,
+            "mean_us": self.total_ns / 1000 / self.calls if self.calls else 0.0,
+            "histogram_us": {
+                f"<{2 ** k}": count for k, count in enumerate(self.histogram) if count
+            },
+        }
+
+
+class Instrumentation:
+    """Collects HandlerStats for every Game it is attached to."""
+
+    def __init__(self, handlers=HANDLERS):
+        self.handlers = handlers
+        self.stats = {name: HandlerStats() for name in handlers}
+
+    def attach(self, game):
+        """Wrap this game's handlers; returns the game for chaining."""
+        for name in self.handlers:
+            setattr(game, name, self._wrap(getattr(game, name), self.stats[name]))
+        return game
+
+    def detach(self, game):
+        """Restore the game's original handlers."""
+        for name in self.handlers:
+            game.__dict__.pop(name, None)
+
+    @staticmethod
+    def _wrap(method, stats):
+        clock = time.perf_counter_ns
+
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                stats.add(clock() - start)
+
+        return timed
+
+    def to_dict(self):
+        return {name: stats.to_dict() for name, stats in self.stats.items()}
+
+    def to_json(self, indent=2):
+        return json.dumps(self.to_dict(), indent=indent)
+
+    def save_json(self, filename):
+        with open(filename, "w", encoding="utf-8") as file:
+            file.write(self.to_json())
+
+
+def play_batch(sessions, steps=50, seed=0, instrumentation=None):
+    """Play `sessions` silent games through handle_command("explore")."""
+    policy = CautiousPolicy()
+    for session in range(sessions):
+        game = Game(f"Sim-{session}", policy=policy, seed=seed + session, sink=NullSink())
+        if instrumentation is not None:
+            instrumentation.attach(game)
+        for _ in range(steps):
+            if not (game.running and game.player.is_alive()):
+                break
+            game.handle_command("explore")
+
+
+def profile_batch(sessions, profile_file=None, stats_file=None, steps=50, top=25):
+    """Profile a headless batch.
+
+    profile_file: save raw pstats data here and print the top functions.
+    stats_file: attach Instrumentation and save its JSON here.
+    """
+    instrumentation = Instrumentation() if stats_file else None
+    profiler = cProfile.Profile() if profile_file else None
+    start = time.perf_counter()
+    if profiler is not None:
+        profiler.enable()
+    play_batch(sessions, steps, instrumentation=instrumentation)
+    if profiler is not None:
+        profiler.disable()
+    elapsed = time.perf_counter() - start
+    print(f"Played {sessions} sessions in {elapsed:.2f}s")
+
+    if profiler is not None:
+        profiler.dump_stats(profile_file)
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(top)
+        print(f"Saved profile to {profile_file}")
+    if instrumentation is not None:
+        instrumentation.save_json(stats_file)
+        print(f"Saved handler timings to {stats_file}")
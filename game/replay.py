@@ -0,0 +1,265 @@
+"""
+Event Log and Replay
+
+Records what happens in a Game as a compact binary log and rebuilds the
+final Player state from it without re-running the game.
+
+- Each event is a 5-byte record: opcode + 32-bit value
+- Names (commands, locations, monsters, items) go into a string table and
+  records refer to them by index
+- Replay applies damage/heal/score/item events directly: no RNG, no
+  printing, no encounter logic
+- replay_many() spreads many logs over a process pool
+
+Usage:
+    log = EventLog()
+    game = Game("Hero", seed=7, log=log)
+    ...
+    log.save("hero.glog")
+    player = replay(EventLog.load("hero.glog"))
+
+Run: python replay.py --sessions 2000   (record, replay and compare)
+"""
+
+import struct
+import time
+
+from game import Game, NullSink, Player
+
+
+# Opcodes
+COMMAND = 1
+LOCATION = 2
+ENCOUNTER = 3
+MONSTER = 4
+ACTION = 5
+DAMAGE = 6
+HEAL = 7
+SCORE = 8
+ITEM_ADDED = 9
+ITEM_REMOVED = 10
+
+OPCODE_NAMES = {
+    COMMAND: "command", LOCATION: "location", ENCOUNTER: "encounter",
+    MONSTER: "monster", ACTION: "action", DAMAGE: "damage", HEAL: "heal",
+    SCORE: "score", ITEM_ADDED: "item_added", ITEM_REMOVED: "item_removed",
+}
+# Opcodes whose value is an index into the string table
+STRING_OPCODES = {COMMAND, LOCATION, ENCOUNTER, MONSTER, ACTION, ITEM_ADDED, ITEM_REMOVED}
+
+RECORD = struct.Struct("<Bi")
+MAGIC = b"GLOG1"
+
+
+class EventLog:
+    """Append-only binary log of one game session."""
+
+    def __init__(self, name=""):
+        """Create an empty log for the named player."""
+        self.name = name
+        self.records = bytearray()
+        self.strings = []
+        self._string_ids = {}
+
+    def __len__(self):
+        """Number of events recorded."""
+        return len(self.records) // RECORD.size
+
+    def _string_id(self, text):
+        """Index of text in the string table, adding it if needed."""
+        string_id = self._string_ids.get(text)
+        if string_id is None:
+            string_id = self._string_ids[text] = len(self.strings)
+            self.strings.append(text)
+        return string_id
+
+    def _add(self, opcode, value):
+        self.records += RECORD.pack(opcode, value)
+
+    # Hooks called by Game and Player
+    def command(self, command):
+        self._add(COMMAND, self._string_id(command))
+
+    def location(self, location):
+        self._add(LOCATION, self._string_id(location))
+
+    def encounter(self, kind):
+        self._add(ENCOUNTER, self._string_id(kind))
+
+    def monster(self, name, action):
+        self._add(MONSTER, self._string_id(name))
+        self._add(ACTION, self._string_id(action))
+
+    def damage(self, amount):
+        self._add(DAMAGE, amount)
+
+    def heal(self, amount):
+        self._add(HEAL, amount)
+
+    def score(self, points):
+        self._add(SCORE, points)
+
+    def item_added(self, item):
+        self._add(ITEM_ADDED, self._string_id(item))
+
+    def item_removed(self, item):
+        self._add(ITEM_REMOVED, self._string_id(item))
+
+    def events(self):
+        """Yield (event name, value) pairs, with names already resolved."""
+        strings = self.strings
+        for opcode, value in RECORD.iter_unpack(self.records):
+            if opcode in STRING_OPCODES:
+                value = strings[value]
+            yield OPCODE_NAMES[opcode], value
+
+    def to_bytes(self):
+        """Serialize as: magic, name, string table, record count, records."""
+        parts = [MAGIC, _pack_string(self.name), struct.pack("<I", len(self.strings))]
+        parts.extend(_pack_string(text) for text in self.strings)
+        parts.append(struct.pack("<I", len(self)))
+        parts.append(bytes(self.records))
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Inverse of to_bytes()."""
+        data = memoryview(data)
+        if bytes(data[:len(MAGIC)]) != MAGIC:
+            raise ValueError("Not a game event log")
+        offset = len(MAGIC)
+        name, offset = _unpack_string(data, offset)
+        log = cls(name)
+        (count,) = struct.unpack_from("<I", data, offset)
+        offset += 4
+        for _ in range(count):
+            text, offset = _unpack_string(data, offset)
+            log._string_id(text)
+        (records,) = struct.unpack_from("<I", data, offset)
+        offset += 4
+        log.records = bytearray(data[offset:offset + records * RECORD.size])
+        return log
+
+    def save(self, filename):
+        """Write the log to a file."""
+        with open(filename, "wb") as file:
+            file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, filename):
+        """Read a log written by save()."""
+        with open(filename, "rb") as file:
+            return cls.from_bytes(file.read())
+
+
+def _pack_string(text):
+    data = text.encode("utf-8")
+    return struct.pack("<H", len(data)) + data
+
+
+def _unpack_string(data, offset):
+    (length,) = struct.unpack_from("<H", data, offset)
+    offset += 2
+    return str(data[offset:offset + length], "utf-8"), offset + length
+
+
+def replay(log):
+    """Rebuild the final Player state from an EventLog (or its bytes)."""
+    if not isinstance(log, EventLog):
+        log = EventLog.from_bytes(log)
+    player = Player(log.name)
+    health = player.health
+    max_health = player.max_health
+    score = player.score
+    location = player.location
+    inventory = player.inventory
+    strings = log.strings
+    for opcode, value in RECORD.iter_unpack(log.records):
+        if opcode == SCORE:
+            score += value
+        elif opcode == DAMAGE:
+            health = max(0, health - value)
+        elif opcode == HEAL:
+            health = min(max_health, health + value)
+        elif opcode == ITEM_ADDED:
+            inventory.append(strings[value])
+        elif opcode == LOCATION:
+            location = strings[value]
+        elif opcode == ITEM_REMOVED:
+            inventory.remove(strings[value])
+    player.health = health
+    player.score = score
+    player.location = location
+    return player
+
+
+def _replay_state(data):
+    """Worker entry point: replay one serialized log to plain values."""
+    player = replay(data)
+    return player.name, player.health, player.score, player.location, player.inventory
+
+
+def replay_many(logs, workers=None, chunksize=64):
+    """Replay many logs (EventLog objects or bytes) in a process pool.
+
+    Returns a list of Players in the same order as the logs.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    data = [log.to_bytes() if isinstance(log, EventLog) else log for log in logs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        states = list(pool.map(_replay_state, data, chunksize=chunksize))
+    players = []
+    for name, health, score, location, inventory in states:
+        player = Player(name)
+        player.health = health
+        player.score = score
+        player.location = location
+        player.inventory = inventory
+        players.append(player)
+    return players
+
+
+def main():
+    """Record silent sessions, replay them and compare with the originals."""
+    import argparse
+
+    from simulate import CautiousPolicy
+
+    parser = argparse.ArgumentParser(description="Record and replay sessions.")
+    parser.add_argument("--sessions", type=int, default=2000)
+    parser.add_argument("--steps", type=int, default=50)
+    args = parser.parse_args()
+
+    policy = CautiousPolicy()
+    logs, finals = [], []
+    start = time.perf_counter()
+    for seed in range(args.sessions):
+        log = EventLog()
+        game = Game(f"Sim-{seed}", policy=policy, seed=seed, log=log, sink=NullSink())
+        for _ in range(args.steps):
+            if not game.player.is_alive():
+                break
+            game.handle_command("explore")
+        logs.append(log)
+        finals.append(game.player)
+    play_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    replayed = [replay(log) for log in logs]
+    replay_time = time.perf_counter() - start
+
+    mismatches = sum(
+        (a.health, a.score, a.location, a.inventory) != (b.health, b.score, b.location, b.inventory)
+        for a, b in zip(finals, replayed)
+    )
+    size = sum(len(log.to_bytes()) for log in logs) / len(logs)
+    print(f"sessions: {args.sessions}  avg log size: {size:.0f} bytes  mismatches: {mismatches}")
+    print(f"play:   {args.sessions / play_time:10,.0f} sessions/sec")
+    print(f"replay: {args.sessions / replay_time:10,.0f} sessions/sec "
+          f"({play_time / replay_time:.0f}x faster)")
+    raise SystemExit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
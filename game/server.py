@@ -0,0 +1,130 @@
+"""
+Multi-Player Game Server
+
+Hosts many Game sessions on one asyncio event loop over TCP. Each
+connection gets its own Game and Player:
+
+- The first line the client sends is the player's name
+- Every following line is passed to Game.handle_command()
+- The fight/run prompt does not block: the game stores the monster and the
+  next line answers it
+- Output is collected in a BufferedSink and sent back after each command,
+  followed by the "> " prompt
+
+Run: python server.py --port 8765
+Then: nc localhost 8765
+"""
+
+import asyncio
+
+from game import BufferedSink, Game
+
+
+PROMPT = b"> "
+
+
+class DeferredPolicy:
+    """Leave every fight/run decision to the player's next line."""
+
+    def choose_action(self, game, monster):
+        return None
+
+
+DEFERRED = DeferredPolicy()
+
+
+class GameServer:
+    """Accepts TCP connections and plays one Game per connection."""
+
+    def __init__(self, host="127.0.0.1", port=8765):
+        self.host = host
+        self.port = port
+        self.server = None
+        # Counters
+        self.sessions_started = 0
+        self.sessions_active = 0
+        self.commands = 0
+
+    async def start(self):
+        """Start listening; returns the port actually bound (useful with port=0)."""
+        self.server = await asyncio.start_server(
+            self.handle_client, self.host, self.port, backlog=4096)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self.port
+
+    async def serve_forever(self):
+        if self.server is None:
+            await self.start()
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handle_client(self, reader, writer):
+        """Play one session over a connection."""
+        self.sessions_started += 1
+        self.sessions_active += 1
+        try:
+            writer.write(b"Enter your name, adventurer: ")
+            line = await reader.readline()
+            name = line.decode("utf-8", "replace").strip() or "Unknown Hero"
+
+            sink = BufferedSink(limit=0)
+            game = Game(name, policy=DEFERRED, sink=sink)
+            game.show_welcome()
+            writer.write(sink.drain().encode("utf-8") + PROMPT)
+            await writer.drain()
+
+            while game.running and game.player.is_alive():
+                line = await reader.readline()
+                if not line:
+                    break
+                command = line.decode("utf-8", "replace").strip()
+                if command:
+                    self.commands += 1
+                    game.handle_command(command)
+                if not game.player.is_alive():
+                    game.show_game_over()
+                    writer.write(sink.drain().encode("utf-8"))
+                elif game.running:
+                    writer.write(sink.drain().encode("utf-8") + PROMPT)
+                else:
+                    writer.write(sink.drain().encode("utf-8"))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.sessions_active -= 1
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+
+def main():
+    """Entry point."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Host adventure game sessions over TCP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    server = GameServer(args.host, args.port)
+
+    async def run():
+        port = await server.start()
+        print(f"Serving adventures on {args.host}:{port}", flush=True)
+        await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        print("\nServer stopped.")
+
+
+if __name__ == "__main__":
+    main()
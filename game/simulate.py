@@ -0,0 +1,162 @@
+"""
+Headless Batch Simulation
+
+Runs many non-interactive adventures so the MONSTERS and LOOT tables can
+be tuned from real numbers instead of hand-played sessions.
+
+- Policies answer the fight/run prompt instead of input()
+- Every session is seeded, so a batch is reproducible
+- Sessions are spread over a process pool in chunks
+
+Run: python simulate.py --sessions 100000 --policy cautious
+"""
+
+from collections import namedtuple
+
+from game import Game, NullSink
+
+
+# One row per simulated session
+SessionResult = namedtuple(
+    "SessionResult",
+    ["seed", "score", "health", "survived", "steps",
+     "monsters", "loot", "allies", "items"],
+)
+
+
+# Policies also provide choose_fight(health, damage) over NumPy arrays so
+# the same object can drive montecarlo.simulate().
+
+class AlwaysFight:
+    """Fight every monster."""
+
+    def choose_action(self, game, monster):
+        return "fight"
+
+    def choose_fight(self, health, damage):
+        """Vectorized form: boolean array, True where the player fights."""
+        return health >= 0
+
+
+class AlwaysRun:
+    """Run from every monster."""
+
+    def choose_action(self, game, monster):
+        return "run"
+
+    def choose_fight(self, health, damage):
+        return health < 0
+
+
+class CautiousPolicy:
+    """Fight only when the hit leaves at least `margin` health."""
+
+    def __init__(self, margin=10):
+        self.margin = margin
+
+    def choose_action(self, game, monster):
+        if game.player.health - monster["damage"] >= self.margin:
+            return "fight"
+        return "run"
+
+    def choose_fight(self, health, damage):
+        return health - damage >= self.margin
+
+
+POLICIES = {
+    "fight": AlwaysFight,
+    "run": AlwaysRun,
+    "cautious": CautiousPolicy,
+}
+
+
+def play_session(seed, policy, max_steps=50):
+    """Play one silent session and return its SessionResult."""
+    game = Game(f"Sim-{seed}", policy=policy, seed=seed, sink=NullSink())
+    player = game.player
+    steps = 0
+    while game.running and player.is_alive() and steps < max_steps:
+        game.explore()
+        steps += 1
+    return SessionResult(
+        seed,
+        player.score,
+        player.health,
+        player.is_alive(),
+        steps,
+        game.encounters["monster"],
+        game.encounters["loot"],
+        game.encounters["ally"],
+        len(player.inventory),
+    )
+
+
+def _play_chunk(args):
+    """Worker entry point: play a contiguous range of seeds."""
+    start, stop, policy, max_steps = args
+    return [play_session(seed, policy, max_steps) for seed in range(start, stop)]
+
+
+def run_sessions(policy, sessions, seed=0, max_steps=50, workers=None,
+                 chunk_size=2000):
+    """Play `sessions` adventures and return a list of SessionResult.
+
+    Session i uses seed + i, so results do not depend on the worker count.
+    workers=1 runs in-process; None uses one process per CPU.
+    """
+    chunks = [
+        (start, min(start + chunk_size, seed + sessions), policy, max_steps)
+        for start in range(seed, seed + sessions, chunk_size)
+    ]
+    if workers == 1 or len(chunks) <= 1:
+        results = []
+        for chunk in chunks:
+            results.extend(_play_chunk(chunk))
+        return results
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for chunk_results in pool.map(_play_chunk, chunks):
+            results.extend(chunk_results)
+    return results
+
+
+def summarize(results):
+    """Aggregate a batch of SessionResult into a dict of averages."""
+    n = len(results)
+    if n == 0:
+        return {"sessions": 0}
+    return {
+        "sessions": n,
+        "mean_score": sum(r.score for r in results) / n,
+        "survival_rate": sum(r.survived for r in results) / n,
+        "mean_steps": sum(r.steps for r in results) / n,
+        "mean_monsters": sum(r.monsters for r in results) / n,
+        "mean_loot": sum(r.loot for r in results) / n,
+        "mean_allies": sum(r.allies for r in results) / n,
+        "mean_items": sum(r.items for r in results) / n,
+    }
+
+
+def main():
+    """Entry point."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run headless adventures.")
+    parser.add_argument("--sessions", type=int, default=10000)
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="cautious")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-steps", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    results = run_sessions(POLICIES[args.policy](), args.sessions, args.seed,
+                           args.max_steps, args.workers)
+    for key, value in summarize(results).items():
+        print(f"{key:>14}: {value:.3f}" if isinstance(value, float) else f"{key:>14}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,348 @@
+"""
+Game Snapshots
+
+Save and resume games, one at a time or millions of players at once.
+
+- save_game()/load_game(): one Game as a small binary file (player state,
+  encounter counts, a pending monster and the random generator state), so
+  a seeded game resumes exactly where it stopped
+- PlayerStore: bulk storage with one fixed-width column per field (health,
+  max health, score, location) plus offset-indexed names and inventories
+- PlayerStore.open() maps the file with mmap: nothing is read until a column
+  is touched, so a leaderboard only pages in scores and the winners' names
+- read_columns() copies just the requested columns without mapping the file
+
+Usage:
+    save_game(game, "hero.gsave")
+    game = load_game("hero.gsave", policy=CautiousPolicy())
+
+    PlayerStore.from_players(players).save("players.gstore")
+    top = leaderboard("players.gstore", 10)
+
+Benchmark against JSON and pickle: python benchmarks/bench_snapshot.py
+"""
+
+import heapq
+import mmap
+import struct
+from array import array
+
+from game import Game, Player
+from replay import _pack_string, _unpack_string
+
+
+# Single games
+
+GAME_MAGIC = b"GSAVE1"
+GAME_FIELDS = struct.Struct("<iiqIII?")  # health, max_health, score, encounters x3, running
+RNG_STATE = struct.Struct("<i625I?d")    # version, Mersenne Twister state, has gauss, gauss
+
+
+def game_to_bytes(game):
+    """Serialize a Game's resumable state."""
+    player = game.player
+    version, state, gauss = game.rng.getstate()
+    counts = game.encounters
+    pending = game.pending_monster["name"] if game.pending_monster else ""
+    parts = [
+        GAME_MAGIC,
+        _pack_string(player.name),
+        _pack_string(player.location),
+        GAME_FIELDS.pack(player.health, player.max_health, player.score, counts["monster"],
+                         counts["loot"], counts["ally"], game.running),
+        _pack_string(pending),
+        RNG_STATE.pack(version, *state, gauss is not None, gauss or 0.0),
+        struct.pack("<I", len(player.inventory.items())),
+    ]
+    for item, count in player.inventory.items():
+        parts.append(_pack_string(item))
+        parts.append(struct.pack("<I", count))
+    return b"".join(parts)
+
+
+def game_from_bytes(data, policy=None, sink=None, log=None):
+    """Rebuild a Game from game_to_bytes() output.
+
+    policy, sink and log are not saved; pass them as for Game().
+    """
+    data = memoryview(data)
+    if bytes(data[:len(GAME_MAGIC)]) != GAME_MAGIC:
+        raise ValueError("Not a saved game")
+    offset = len(GAME_MAGIC)
+    name, offset = _unpack_string(data, offset)
+    location, offset = _unpack_string(data, offset)
+    health, max_health, score, monsters, loot, allies, running = GAME_FIELDS.unpack_from(
+        data, offset)
+    offset += GAME_FIELDS.size
+    pending, offset = _unpack_string(data, offset)
+    version, *state, has_gauss, gauss = RNG_STATE.unpack_from(data, offset)
+    offset += RNG_STATE.size
+    (item_count,) = struct.unpack_from("<I", data, offset)
+    offset += 4
+
+    game = Game(name, policy=policy, log=log, sink=sink)
+    game.rng.setstate((version, tuple(state), gauss if has_gauss else None))
+    player = game.player
+    player.health = health
+    player.max_health = max_health
+    player.score = score
+    player.location = location
+    for _ in range(item_count):
+        item, offset = _unpack_string(data, offset)
+        (count,) = struct.unpack_from("<I", data, offset)
+        offset += 4
+        player.inventory.append(item, count)
+    game.encounters = {"monster": monsters, "loot": loot, "ally": allies}
+    game.running = running
+    if pending:
+        game.pending_monster = next(m for m in game.MONSTERS if m["name"] == pending)
+    return game
+
+
+def save_game(game, filename):
+    """Write one game to a file."""
+    with open(filename, "wb") as file:
+        file.write(game_to_bytes(game))
+
+
+def load_game(filename, policy=None, sink=None, log=None):
+    """Read a game written by save_game()."""
+    with open(filename, "rb") as file:
+        return game_from_bytes(file.read(), policy=policy, sink=sink, log=log)
+
+
+# Bulk player storage
+
+STORE_MAGIC = b"GPLAYER1"
+STORE_HEADER = struct.Struct("<8sQQQQ")  # magic, rows, inventory entries, names bytes, strings bytes
+
+# Column name -> array typecode; sections are written in this order
+COLUMNS = {
+    "health": "i",
+    "max_health": "i",
+    "score": "q",
+    "location": "H",       # index into the string table
+    "name_offsets": "Q",   # rows + 1 offsets into the name blob
+    "inv_offsets": "Q",    # rows + 1 offsets into inv_items/inv_counts
+    "inv_items": "H",      # index into the string table
+    "inv_counts": "I",
+    "names": None,         # UTF-8 blob
+    "strings": None,       # locations and item names, "\0"-separated
+}
+
+
+def _layout(rows, entries, names_len, strings_len):
+    """Byte offset and length of every section, each aligned to 8 bytes."""
+    lengths = {
+        "health": rows * 4,
+        "max_health": rows * 4,
+        "score": rows * 8,
+        "location": rows * 2,
+        "name_offsets": (rows + 1) * 8,
+        "inv_offsets": (rows + 1) * 8,
+        "inv_items": entries * 2,
+        "inv_counts": entries * 4,
+        "names": names_len,
+        "strings": strings_len,
+    }
+    layout = {}
+    pos = STORE_HEADER.size
+    for name in COLUMNS:
+        layout[name] = (pos, lengths[name])
+        pos += lengths[name] + (-lengths[name] % 8)
+    return layout
+
+
+def _read_header(header_bytes):
+    magic, rows, entries, names_len, strings_len = STORE_HEADER.unpack(header_bytes)
+    if magic != STORE_MAGIC:
+        raise ValueError("Not a player store")
+    return rows, entries, names_len, strings_len
+
+
+class PlayerStore:
+    """Column-per-field storage for many players' state.
+
+    Build one with add() / from_players(), write it with save(), and
+    reopen it with open() (memory-mapped, read-only) to look up single
+    players, materialize them all, or run a leaderboard.
+    """
+
+    def __init__(self):
+        """Create an empty store."""
+        self.health = array("i")
+        self.max_health = array("i")
+        self.score = array("q")
+        self.location = array("H")
+        self.names = []
+        self.inv_offsets = array("Q", [0])
+        self.inv_items = array("H")
+        self.inv_counts = array("I")
+        self.strings = []
+        self._string_ids = {}
+        self._mmap = None
+
+    def __len__(self):
+        return len(self.score)
+
+    def _string_id(self, text):
+        string_id = self._string_ids.get(text)
+        if string_id is None:
+            string_id = self._string_ids[text] = len(self.strings)
+            self.strings.append(text)
+        return string_id
+
+    def add(self, player):
+        """Append one Player's state."""
+        if self._mmap is not None:
+            raise ValueError("Store opened from a file is read-only")
+        self.health.append(player.health)
+        self.max_health.append(player.max_health)
+        self.score.append(player.score)
+        self.location.append(self._string_id(player.location))
+        self.names.append(player.name)
+        for item, count in player.inventory.items():
+            self.inv_items.append(self._string_id(item))
+            self.inv_counts.append(count)
+        self.inv_offsets.append(len(self.inv_items))
+
+    @classmethod
+    def from_players(cls, players):
+        """Build a store from an iterable of Players."""
+        store = cls()
+        for player in players:
+            store.add(player)
+        return store
+
+    def player(self, row, sink=None):
+        """Rebuild the Player stored at row."""
+        player = Player(self.names[row], sink)
+        player.health = self.health[row]
+        player.max_health = self.max_health[row]
+        player.score = self.score[row]
+        player.location = self.strings[self.location[row]]
+        strings, items, counts = self.strings, self.inv_items, self.inv_counts
+        for entry in range(self.inv_offsets[row], self.inv_offsets[row + 1]):
+            player.inventory.append(strings[items[entry]], counts[entry])
+        return player
+
+    def players(self, sink=None):
+        """Yield every stored Player in order."""
+        for row in range(len(self)):
+            yield self.player(row, sink)
+
+    def save(self, filename):
+        """Write the store to a file."""
+        encoded = [name.encode("utf-8") for name in self.names]
+        name_offsets = array("Q", [0])
+        total = 0
+        for name in encoded:
+            total += len(name)
+            name_offsets.append(total)
+        names = b"".join(encoded)
+        strings = "\0".join(self.strings).encode("utf-8")
+        sections = [self.health, self.max_health, self.score, self.location, name_offsets,
+                    self.inv_offsets, self.inv_items, self.inv_counts, names, strings]
+        with open(filename, "wb") as file:
+            file.write(STORE_HEADER.pack(STORE_MAGIC, len(self), len(self.inv_items),
+                                         len(names), len(strings)))
+            for section in sections:
+                data = memoryview(section).cast("B")
+                file.write(data)
+                file.write(b"\0" * (-len(data) % 8))
+
+    @classmethod
+    def open(cls, filename):
+        """Map a saved store read-only; columns are read on first touch."""
+        with open(filename, "rb") as file:
+            mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            rows, entries, names_len, strings_len = _read_header(mm[:STORE_HEADER.size])
+        except (ValueError, struct.error):
+            mm.close()
+            raise ValueError(f"{filename} is not a player store") from None
+        view = memoryview(mm)
+        sections = {}
+        for name, (pos, length) in _layout(rows, entries, names_len, strings_len).items():
+            data = view[pos:pos + length]
+            sections[name] = data.cast(COLUMNS[name]) if COLUMNS[name] else data
+
+        store = cls()
+        store.health = sections["health"]
+        store.max_health = sections["max_health"]
+        store.score = sections["score"]
+        store.location = sections["location"]
+        store.names = _NameColumn(sections["names"], sections["name_offsets"])
+        store.inv_offsets = sections["inv_offsets"]
+        store.inv_items = sections["inv_items"]
+        store.inv_counts = sections["inv_counts"]
+        strings = str(sections["strings"], "utf-8")
+        store.strings = strings.split("\0") if rows else []
+        store._string_ids = {text: i for i, text in enumerate(store.strings)}
+        store._mmap = mm
+        return store
+
+    def close(self):
+        """Release the file mapping of a store from open()."""
+        if self._mmap is not None:
+            for name in ("health", "max_health", "score", "location", "inv_offsets",
+                         "inv_items", "inv_counts"):
+                getattr(self, name).release()
+            self.names.release()
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def leaderboard(self, n=10):
+        """Top n (name, score) pairs, highest score first."""
+        top = heapq.nlargest(n, zip(self.score, range(len(self))))
+        return [(self.names[row], score) for score, row in top]
+
+
+class _NameColumn:
+    """Read-only view of names stored as one UTF-8 blob plus offsets."""
+
+    def __init__(self, blob, offsets):
+        self._blob = blob
+        self._offsets = offsets
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, row):
+        return str(self._blob[self._offsets[row]:self._offsets[row + 1]], "utf-8")
+
+    def release(self):
+        self._blob.release()
+        self._offsets.release()
+
+
+def read_columns(filename, fields=("score",)):
+    """Copy only the named fixed-width columns of a saved store into arrays.
+
+    fields: any of health, max_health, score, location.
+    Returns {field: array}; other sections are never read.
+    """
+    with open(filename, "rb") as file:
+        layout = _layout(*_read_header(file.read(STORE_HEADER.size)))
+        columns = {}
+        for field in fields:
+            if field not in ("health", "max_health", "score", "location"):
+                raise ValueError(f"Not a fixed-width column: {field}")
+            pos, length = layout[field]
+            column = array(COLUMNS[field], bytes(length))
+            file.seek(pos)
+            file.readinto(memoryview(column).cast("B"))
+            columns[field] = column
+    return columns
+
+
+def leaderboard(filename, n=10):
+    """Top n (name, score) pairs from a saved store, reading only what is needed."""
+    with PlayerStore.open(filename) as store:
+        return store.leaderboard(n)
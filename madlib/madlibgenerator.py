@@ -5,6 +5,26 @@ using those words. The story is printed to the terminal and saved
 to a text file.
 """
 
+import csv
+import functools
+import itertools
+import json
+import operator
+import os
+import queue
+import string
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+
+
+# Story template used when none is given
+DEFAULT_TEMPLATE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "madlibtemplate.txt")
+
+# Word order of WordBank's arguments, CSV columns and word tuples
+WORD_FIELDS = ("noun", "verb", "adjective", "place", "emotion", "animal", "celebrity", "object")
+
 
 class WordBank:
     """A class to store words for use in the Mad Libs story."""
@@ -32,6 +52,284 @@ class WordBank:
         self.object = object_
 
 
+class StoryTemplate:
+    """A story template compiled once into literal text and word slots.
+    
+    Slots use str.format syntax naming WordBank attributes, e.g. {noun}.
+    Rendering copies the segment list, drops the words into the slot
+    positions and joins it, so the template text is never parsed again.
+    """
+    
+    def __init__(self, text: str):
+        """Compile the template text.
+        
+        Args:
+            text: Template text with {attribute} slots.
+        """
+        self.segments = []
+        self.slots = []
+        for literal, field, _spec, _conversion in string.Formatter().parse(text):
+            if literal:
+                self.segments.append(literal)
+            if field is not None:
+                self.slots.append((len(self.segments), field))
+                self.segments.append("")
+        self._positions = [position for position, _ in self.slots]
+        fields = [field for _, field in self.slots]
+        getter = operator.attrgetter(*fields) if fields else (lambda word_bank: ())
+        # attrgetter returns a bare value, not a tuple, for a single field
+        self._get_words = getter if len(fields) != 1 else (lambda wb: (getter(wb),))
+        # Where each slot's word sits in a WORD_FIELDS tuple (None if the
+        # template uses other fields)
+        self._word_indexes = (tuple(WORD_FIELDS.index(field) for field in fields)
+                              if set(fields) <= set(WORD_FIELDS) else None)
+    
+    def render(self, word_bank: WordBank) -> str:
+        """Render the template for one WordBank."""
+        parts = self.segments[:]
+        for position, word in zip(self._positions, self._get_words(word_bank)):
+            parts[position] = word
+        return "".join(parts)
+    
+    def render_words(self, words: tuple) -> str:
+        """Render the template for a tuple of words in WORD_FIELDS order."""
+        if self._word_indexes is None:
+            raise ValueError("Template uses fields other than WORD_FIELDS")
+        parts = self.segments[:]
+        for position, index in zip(self._positions, self._word_indexes):
+            parts[position] = words[index]
+        return "".join(parts)
+    
+    def render_many(self, word_banks: Iterable[WordBank]) -> Iterator[str]:
+        """Render the template for each WordBank in turn."""
+        segments = self.segments
+        positions = self._positions
+        get_words = self._get_words
+        join = "".join
+        for word_bank in word_banks:
+            parts = segments[:]
+            for position, word in zip(positions, get_words(word_bank)):
+                parts[position] = word
+            yield join(parts)
+
+
+@functools.lru_cache(maxsize=None)
+def load_template(filename: str = DEFAULT_TEMPLATE) -> StoryTemplate:
+    """Load and compile a story template, once per file.
+    
+    Args:
+        filename: Path to the template file (default: madlibtemplate.txt).
+        
+    Returns:
+        The compiled StoryTemplate.
+    """
+    with open(filename, "r", encoding="utf-8") as file:
+        return StoryTemplate(file.read())
+
+
+def read_word_rows(filename: str) -> Iterator[tuple]:
+    """Stream word tuples from a CSV or JSONL file.
+    
+    Every word is interned, so a word repeated across rows is stored once.
+    A row identical to a recent one is returned as the same tuple object,
+    which makes duplicates cheap to read and to look up in a StoryCache.
+    
+    Args:
+        filename: CSV with a header row of
+            noun,verb,adjective,place,emotion,animal,celebrity,object
+            or, for a ".jsonl" file, one JSON object per line with those keys.
+        
+    Yields:
+        One tuple of words per row, in WORD_FIELDS order.
+    """
+    intern = sys.intern
+    recent = {}  # row -> its interned tuple, reset when it grows too big
+    
+    def canonical(words):
+        known = recent.get(words)
+        if known is None:
+            if len(recent) >= 1 << 16:
+                recent.clear()
+            known = recent[words] = tuple(map(intern, words))
+        return known
+    
+    with open(filename, "r", newline="", encoding="utf-8") as file:
+        if filename.endswith(".jsonl"):
+            get_words = operator.itemgetter(*WORD_FIELDS)
+            for line in file:
+                if line.strip():
+                    yield canonical(get_words(json.loads(line)))
+            return
+        reader = csv.reader(file)
+        header = next(reader, None)
+        if header is None:
+            return
+        get_words = operator.itemgetter(*(header.index(field) for field in WORD_FIELDS))
+        for row in reader:
+            yield canonical(get_words(row))
+
+
+def read_word_banks(filename: str) -> Iterator[WordBank]:
+    """Stream WordBanks from a CSV or JSONL file (see read_word_rows).
+    
+    Args:
+        filename: CSV with one column per word, or JSONL.
+        
+    Yields:
+        One WordBank per row.
+    """
+    for words in read_word_rows(filename):
+        yield WordBank(*words)
+
+
+class StoryCache:
+    """LRU cache of rendered stories keyed by word tuple.
+    
+    Duplicate submissions are answered from the cache without rendering;
+    hits and misses are counted so callers can report the duplicate rate.
+    """
+    
+    def __init__(self, maxsize: int = 1 << 16):
+        """Create an empty cache holding at most maxsize stories."""
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._stories = OrderedDict()
+    
+    def __len__(self) -> int:
+        return len(self._stories)
+    
+    def get(self, words: tuple) -> "str | None":
+        """Return the cached story for words, or None."""
+        story = self._stories.get(words)
+        if story is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._stories.move_to_end(words)
+        return story
+    
+    def put(self, words: tuple, story: str) -> None:
+        """Cache a rendered story, evicting the least recently used one."""
+        self._stories[words] = story
+        if len(self._stories) > self.maxsize:
+            self._stories.popitem(last=False)
+
+
+def render_rows(rows: Iterable[tuple], template: "StoryTemplate | None" = None,
+                cache: "StoryCache | None" = None, unique: bool = False) -> Iterator[str]:
+    """Render word tuples in order, rendering each distinct tuple once.
+    
+    Args:
+        rows: Word tuples in WORD_FIELDS order (e.g. from read_word_rows).
+        template: A compiled StoryTemplate (default: madlibtemplate.txt).
+        cache: StoryCache to use (default: a new one).
+        unique: Skip rows that repeat an earlier row instead of repeating
+            their story.
+        
+    Yields:
+        One story per row (per distinct row with unique=True).
+    
+    The cache's hit and miss counts are updated when the generator ends.
+    """
+    template = load_template() if template is None else template
+    cache = StoryCache() if cache is None else cache
+    seen = set() if unique else None
+    render = template.render_words
+    # Same as cache.get()/put() without a method call per row
+    stories = cache._stories
+    get, move_to_end = stories.get, stories.move_to_end
+    hits = misses = 0
+    try:
+        for words in rows:
+            if seen is not None:
+                if words in seen:
+                    hits += 1
+                    continue
+                seen.add(words)
+            story = get(words)
+            if story is None:
+                misses += 1
+                story = render(words)
+                cache.put(words, story)
+            else:
+                hits += 1
+                move_to_end(words)
+            yield story
+    finally:
+        cache.hits += hits
+        cache.misses += misses
+
+
+def _render_chunk(template_file: str, rows: list) -> list:
+    """Pool worker: render a list of word tuples."""
+    render = load_template(template_file).render_words
+    return [render(words) for words in rows]
+
+
+def render_file(filename: str, template_file: str = DEFAULT_TEMPLATE, workers: "int | None" = 1,
+                chunk_size: int = 50000, cache: "StoryCache | None" = None,
+                unique: bool = False) -> Iterator[str]:
+    """Render every row of a word-bank CSV/JSONL file, in file order.
+    
+    Rows are read in chunks; rows already in the cache (or repeated within
+    the chunk) are not rendered again. With workers other than 1, the
+    remaining distinct rows of each chunk are split across a process pool
+    (None = one process per CPU).
+    
+    Args:
+        filename: Word-bank CSV or JSONL file.
+        template_file: Template to render (each worker loads it once).
+        workers: Pool size; 1 renders in this process.
+        chunk_size: Rows read per batch.
+        cache: StoryCache to use (default: a new one).
+        unique: Skip rows that repeat an earlier row.
+        
+    Yields:
+        One story per row (per distinct row with unique=True).
+    """
+    cache = StoryCache() if cache is None else cache
+    rows = read_word_rows(filename)
+    if workers == 1:
+        yield from render_rows(rows, load_template(template_file), cache, unique)
+        return
+    
+    from concurrent.futures import ProcessPoolExecutor
+    
+    processes = workers or os.cpu_count() or 1
+    seen = set() if unique else None
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while True:
+            chunk = list(itertools.islice(rows, chunk_size))
+            if not chunk:
+                break
+            if seen is not None:
+                size = len(chunk)
+                chunk = [words for words in dict.fromkeys(chunk) if words not in seen]
+                seen.update(chunk)
+                cache.hits += size - len(chunk)
+            stories = {}
+            missing = []
+            for words in chunk:
+                if words in stories:
+                    cache.hits += 1
+                    continue
+                story = cache.get(words)
+                stories[words] = story
+                if story is None:
+                    missing.append(words)
+            if missing:
+                size = -(-len(missing) // processes)
+                parts = [missing[i:i + size] for i in range(0, len(missing), size)]
+                rendered = pool.map(_render_chunk, itertools.repeat(template_file), parts)
+                for part, part_stories in zip(parts, rendered):
+                    for words, story in zip(part, part_stories):
+                        stories[words] = story
+                        cache.put(words, story)
+            for words in chunk:
+                yield stories[words]
+
+
 def collect_words() -> WordBank:
     """Collect words from the user interactively.
     
@@ -53,45 +351,19 @@ def collect_words() -> WordBank:
     return WordBank(noun, verb, adjective, place, emotion, animal, celebrity, object_)
 
 
-def generate_story(word_bank: WordBank) -> str:
+def generate_story(word_bank: WordBank, template: "StoryTemplate | None" = None) -> str:
     """Generate a silly story using the words from the WordBank.
     
     Args:
         word_bank: A WordBank object containing all the words.
+        template: A compiled StoryTemplate (default: madlibtemplate.txt).
         
     Returns:
         A string containing the complete story.
     """
-    story = f"""
-╔═══════════════════════════════════════════════════════════════╗
-║                    THE WILD ADVENTURE                         ║
-╚═══════════════════════════════════════════════════════════════╝
-
-One day, a {word_bank.adjective} {word_bank.noun} decided to {word_bank.verb} 
-in the magical land of {word_bank.place}. 
-
-The {word_bank.noun} was feeling {word_bank.emotion}, so they decided to 
-seek help from their best friend, a talking {word_bank.animal}. 
-
-Together, they journeyed through forests, crossed rivers, and eventually 
-ran into the famous {word_bank.celebrity}, who was also looking for a 
-mysterious {word_bank.object}.
-
-"I will help you find it!" said the {word_bank.celebrity}, striking a heroic pose.
-
-The three friends spent the whole day searching, laughing, and causing 
-mayhem wherever they went. Finally, they discovered the {word_bank.object} 
-hidden behind a giant {word_bank.adjective} rock.
-
-With their quest complete, the {word_bank.noun}, the {word_bank.animal}, 
-and {word_bank.celebrity} became the best of friends forever, and they 
-all lived happily ever after in {word_bank.place}.
-
-                            THE END
-
-═══════════════════════════════════════════════════════════════════
-"""
-    return story
+    if template is None:
+        template = load_template()
+    return template.render(word_bank)
 
 
 def save_story(story: str, filename: str = "madlib_story.txt") -> None:
@@ -106,8 +378,176 @@ def save_story(story: str, filename: str = "madlib_story.txt") -> None:
     print(f"✓ Story saved to {filename}\n")
 
 
+class StoryWriter:
+    """Buffered bulk writer for many stories in one file.
+    
+    Stories are collected into batches of about buffer_size characters and
+    each batch is written with a single call. With background=True a
+    thread does the writing (and gzip compression) while the caller keeps
+    rendering.
+    
+    Formats: "text" (stories back to back), "jsonl" (one {"story": ...}
+    object per line) or "gzip" (text, gzip-compressed). Without an explicit
+    format it is taken from the extension, and a ".jsonl.gz" file is
+    gzip-compressed JSONL.
+    """
+    
+    def __init__(self, filename: str, format: "str | None" = None,
+                 buffer_size: int = 1 << 20, background: bool = False):
+        """Open the output file.
+        
+        Args:
+            filename: The file to write.
+            format: "text", "jsonl" or "gzip" (default: from the extension).
+            buffer_size: Characters collected before each write.
+            background: Write batches from a background thread.
+        """
+        compress = format == "gzip"
+        if format is None:
+            compress = filename.endswith(".gz")
+            if filename.endswith((".jsonl", ".jsonl.gz")):
+                format = "jsonl"
+            elif compress:
+                format = "gzip"
+            else:
+                format = "text"
+        if format not in ("text", "jsonl", "gzip"):
+            raise ValueError(f"Unknown story format: {format!r}")
+        self.filename = filename
+        self.format = format
+        self.buffer_size = buffer_size
+        self.count = 0
+        self._jsonl = format == "jsonl"
+        # Batches already set the write size, so default file buffering is enough
+        self._raw = self._file = open(filename, "wb")
+        if compress:
+            import gzip
+            self._file = gzip.GzipFile(fileobj=self._raw, mode="wb", compresslevel=6)
+        self._batch = []
+        self._batch_size = 0
+        self._queue = None
+        self._thread = None
+        self._error = None
+        if background:
+            self._queue = queue.Queue(maxsize=8)
+            self._thread = threading.Thread(target=self._drain, daemon=True)
+            self._thread.start()
+    
+    def write(self, story: str) -> None:
+        """Add one story to the output."""
+        if self._jsonl:
+            story = json.dumps({"story": story}, ensure_ascii=False) + "\n"
+        self._batch.append(story)
+        self._batch_size += len(story)
+        self.count += 1
+        if self._batch_size >= self.buffer_size:
+            self.flush()
+    
+    def write_many(self, stories: Iterable[str]) -> None:
+        """Add every story from an iterable."""
+        for story in stories:
+            self.write(story)
+    
+    def flush(self) -> None:
+        """Hand the current batch to the file (or the writer thread)."""
+        if not self._batch:
+            return
+        data = "".join(self._batch).encode("utf-8")
+        self._batch = []
+        self._batch_size = 0
+        if self._queue is None:
+            self._file.write(data)
+        else:
+            if self._error is not None:
+                raise self._error
+            self._queue.put(data)
+    
+    def close(self) -> None:
+        """Flush everything and close the file."""
+        try:
+            if self._error is None:
+                self.flush()
+        finally:
+            if self._thread is not None:
+                # The thread drains until the sentinel even after an error
+                self._queue.put(None)
+                self._thread.join()
+                self._thread = None
+            self._file.close()
+            self._raw.close()
+        if self._error is not None:
+            raise self._error
+    
+    def _drain(self) -> None:
+        """Writer thread: write batches until the None sentinel arrives."""
+        while True:
+            data = self._queue.get()
+            if data is None:
+                return
+            if self._error is None:
+                try:
+                    self._file.write(data)
+                except Exception as error:
+                    # Keep draining so flush() never blocks on a full queue;
+                    # the error is raised by the next flush() or close()
+                    self._error = error
+    
+    def __enter__(self) -> "StoryWriter":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def save_stories(stories: Iterable[str], filename: str, format: "str | None" = None,
+                 buffer_size: int = 1 << 20, background: bool = False) -> int:
+    """Stream many stories into a single text, JSONL or gzip file.
+    
+    Args:
+        stories: The story texts to save.
+        filename: The file to write.
+        format: "text", "jsonl" or "gzip" (default: from the extension).
+        buffer_size: Characters collected before each write.
+        background: Write batches from a background thread.
+        
+    Returns:
+        The number of stories written.
+    """
+    with StoryWriter(filename, format, buffer_size, background) as writer:
+        writer.write_many(stories)
+    print(f"✓ Saved {writer.count} stories to {filename}\n")
+    return writer.count
+
+
 def main():
-    """Main function to run the Mad Libs generator."""
+    """Main function to run the Mad Libs generator.
+    
+    With --batch FILE, renders every row of a word-bank CSV/JSONL file
+    into one output file instead of asking for words.
+    """
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Mad Libs story generator.")
+    parser.add_argument("--batch", metavar="FILE", help="word-bank CSV or JSONL file to render")
+    parser.add_argument("--out", default="madlib_stories.txt",
+                        help="output file for --batch (.jsonl / .gz select the format)")
+    parser.add_argument("--template", default=DEFAULT_TEMPLATE, help="story template file")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="render processes for --batch (0 = one per CPU)")
+    parser.add_argument("--unique", action="store_true", help="skip duplicate word banks")
+    args = parser.parse_args()
+    
+    if args.batch:
+        cache = StoryCache()
+        stories = render_file(args.batch, args.template, args.workers or None,
+                              cache=cache, unique=args.unique)
+        save_stories(stories, args.out, background=True)
+        total = cache.hits + cache.misses
+        if total:
+            print(f"Rendered {cache.misses} distinct stories for {total} word banks "
+                  f"({cache.hits / total:.0%} duplicates)")
+        return
+    
     # Collect words from user
     word_bank = collect_words()
     
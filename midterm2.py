@@ -1,10 +1,19 @@
 import csv
+import heapq
+import mmap
+import operator
+import os
+import struct
+from array import array
+from bisect import bisect_left, bisect_right
+
+# The challenge demos only run from main(), so importing this module has no
+# side effects. glob and concurrent.futures are imported where they are
+# used to keep imports fast.
 
 # Challenge 1 -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # Define classes
 
-print("\nCHALLENGE 1\n")
-
 class Account:
     def __init__(self, deposit, withdraw):
         self._deposit = deposit
@@ -34,24 +43,93 @@ class CheckingAccount(Account):
         balance = self._deposit - self._withdraw - self.overdraft
         print(f"Checking Account balance (with overdraft): ${balance}")
 
-# Create accounts
-accounts = [
-    SavingsAccount(1000, 200, 50),
-    CheckingAccount(1500, 500, 100),
-    SavingsAccount(500, 50, 10),
-    CheckingAccount(800, 100, 0),
-]
 
-# Loop and call a method to show balances on each account
-for account in accounts:
-    account.show_balance()
+# Batch balances: instead of one show_balance() call per account, every
+# balance is computed in a single comprehension that switches on the
+# account's type inline (no method call, no print per account). Subclasses
+# take the slower _balance() path, using their base class's rule.
+# Run benchmarks/bench_balances.py to compare with per-object calls.
+
+class BalanceTable:
+    # DataFrame-like result: parallel columns, one row per account in the
+    # order the accounts were given
+    def __init__(self, accounts, balances):
+        self.accounts = accounts
+        self.balances = balances  # array('d')
+        self._types = None
+        self._kinds = None
+
+    @property
+    def types(self):
+        # Account class per row, built on first use
+        if self._types is None:
+            self._types = list(map(type, self.accounts))
+        return self._types
+
+    @property
+    def kinds(self):
+        # Account class name per row, built on first use
+        if self._kinds is None:
+            self._kinds = list(map(operator.attrgetter('__name__'), self.types))
+        return self._kinds
+
+    def __len__(self):
+        return len(self.balances)
+
+    def __getitem__(self, row):
+        return type(self.accounts[row]).__name__, self.balances[row]
+
+    def columns(self):
+        return {'kind': self.kinds, 'balance': self.balances}
+
+    def total(self):
+        return sum(self.balances)
+
+    def totals_by_kind(self):
+        totals = {}
+        for cls, balance in zip(self.types, self.balances):
+            totals[cls] = totals.get(cls, 0.0) + balance
+        return {cls.__name__: total for cls, total in totals.items()}
+
+def _balance(account):
+    # Any Account subclass, by its base class's rule
+    if not isinstance(account, Account):
+        raise TypeError(f"No balance rule for {type(account).__name__}")
+    balance = account._deposit - account._withdraw
+    if isinstance(account, SavingsAccount):
+        return balance + account.interest
+    if isinstance(account, CheckingAccount):
+        return balance - account.overdraft
+    return balance
+
+def compute_balances(accounts):
+    accounts = accounts if isinstance(accounts, list) else list(accounts)
+    savings, checking, plain = SavingsAccount, CheckingAccount, Account
+    balances = [a._deposit - a._withdraw + a.interest if type(a) is savings else
+                a._deposit - a._withdraw - a.overdraft if type(a) is checking else
+                a._deposit - a._withdraw if type(a) is plain else
+                _balance(a) for a in accounts]
+    return BalanceTable(accounts, array('d', balances))
+
+def challenge1():
+    print("\nCHALLENGE 1\n")
+
+    # Create accounts
+    accounts = [
+        SavingsAccount(1000, 200, 50),
+        CheckingAccount(1500, 500, 100),
+        SavingsAccount(500, 50, 10),
+        CheckingAccount(800, 100, 0),
+    ]
+
+    # Loop and call a method to show balances on each account
+    for account in accounts:
+        account.show_balance()
 
 
 # Challenge 2 -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # Define classes
 
-print("\nCHALLENGE 2\n")
-
 class Product:
     def __init__(self, name, quantity):
         self.name = name
@@ -64,13 +142,23 @@ class Product:
     def __str__(self):
         return f"Product: {self.name}, Quantity: {self.quantity}"
     
+# Same as Product but with __slots__ instead of a per-instance __dict__
+class SlottedProduct:
+    __slots__ = ('name', 'quantity')
+    __init__ = Product.__init__
+    restock = Product.restock
+    __str__ = Product.__str__
+
 class Supplier:
     def __init__(self, name):
         self.name = name
         self.products = []  # Composition: Supplier has Products
+        self.inventories = []  # Inventories indexing this supplier's products
 
     def add_product(self, product):
         self.products.append(product)
+        for inventory in self.inventories:
+            inventory._index_product(self, product)
 
     def __str__(self):
         return f"Supplier: {self.name}"
@@ -78,9 +166,47 @@ class Supplier:
 class Inventory:
     def __init__(self):
         self.suppliers = []
+        # Indexes kept up to date by add_supplier / Supplier.add_product
+        self._by_name = {}  # product name -> first product with that name
+        self._by_supplier = {}  # supplier name -> {product name: product}
 
     def add_supplier(self, supplier):
         self.suppliers.append(supplier)
+        supplier.inventories.append(self)
+        self._by_supplier.setdefault(supplier.name, {})
+        for product in supplier.products:
+            self._index_product(supplier, product)
+
+    def _index_product(self, supplier, product):
+        self._by_name.setdefault(product.name, product)
+        self._by_supplier[supplier.name].setdefault(product.name, product)
+
+    def find_product(self, name, supplier=None):
+        if supplier is None:
+            return self._by_name.get(name)
+        return self._by_supplier.get(supplier, {}).get(name)
+
+    def products_by_supplier(self, supplier):
+        return list(self._by_supplier.get(supplier, {}).values())
+
+    def restock_many(self, updates):
+        # Apply (product, amount) pairs without printing. A product can be
+        # given as a Product, a name, or a (supplier name, product name)
+        # pair. Returns the keys that matched no product.
+        by_name = self._by_name
+        missing = []
+        for key, amount in updates:
+            if isinstance(key, str):
+                product = by_name.get(key)
+            elif isinstance(key, tuple):
+                product = self.find_product(key[1], key[0])
+            else:
+                product = key
+            if product is None:
+                missing.append(key)
+            else:
+                product.quantity += amount
+        return missing
 
     def print_inventory(self):
         print("Inventory:")
@@ -90,30 +216,31 @@ class Inventory:
                 print(f"  {product}")
 
 # Example usage
-inv = Inventory()
-s1 = Supplier("Acme")
-s2 = Supplier("Walmart")
-p1 = Product("Steak", 10)
-p2 = Product("Bread", 5)
-p3 = Product("Candy", 2)
-s1.add_product(p1)
-s1.add_product(p2)
-s2.add_product(p3)
-inv.add_supplier(s1)
-inv.add_supplier(s2)
-
-# Restock products
-p1.restock(5)
-p3.restock(10)
-
-# Print inventory
-inv.print_inventory()
+def challenge2():
+    print("\nCHALLENGE 2\n")
+
+    inv = Inventory()
+    s1 = Supplier("Acme")
+    s2 = Supplier("Walmart")
+    p1 = Product("Steak", 10)
+    p2 = Product("Bread", 5)
+    p3 = Product("Candy", 2)
+    s1.add_product(p1)
+    s1.add_product(p2)
+    s2.add_product(p3)
+    inv.add_supplier(s1)
+    inv.add_supplier(s2)
+
+    # Restock products
+    p1.restock(5)
+    p3.restock(10)
+
+    # Print inventory
+    inv.print_inventory()
 
 # Challenge 3 -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # Define classes
 
-print("\nCHALLENGE 2\n")
-
 class Student:
     def __init__(self, name, gpa, major):
         self.name = name
@@ -122,25 +249,120 @@ class Student:
     def __str__(self):
         return f"{self.name} | GPA: {self.gpa} | Major: {self.major}"
 
+# Same as Student but with __slots__ instead of a per-instance __dict__
+class SlottedStudent:
+    __slots__ = ('name', 'gpa', 'major')
+    __init__ = Student.__init__
+    __str__ = Student.__str__
+
+def _iter_csv(filename):
+    try:
+        with open(filename, 'r', newline='') as f:
+            for row in csv.DictReader(f):
+                yield Student(row['name'], row['gpa'], row['major'])
+    except FileNotFoundError:
+        print(f"Error: File '{filename}' not found.")
+    except Exception as e:
+        print(f"Error reading file: {e}")
+
+def _scan_csv(filename, min_gpa, max_gpa, majors):
+    # Predicate pushdown: test the raw CSV fields and yield (name, gpa, major)
+    # only for matching rows, so rejected rows never become Student objects
+    try:
+        with open(filename, 'r', newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return
+            name_col, gpa_col, major_col = (header.index(c) for c in ('name', 'gpa', 'major'))
+            for row in reader:
+                major = row[major_col]
+                if majors is not None and major not in majors:
+                    continue
+                gpa = float(row[gpa_col])
+                if min_gpa <= gpa <= max_gpa:
+                    yield row[name_col], gpa, major
+    except FileNotFoundError:
+        print(f"Error: File '{filename}' not found.")
+    except Exception as e:
+        print(f"Error reading file: {e}")
+
+def _read_csv_rows(filename):
+    # Pool worker: plain tuples pickle much faster than Student objects
+    return [(s.name, s.gpa, s.major) for s in _iter_csv(filename)]
+
+def _write_csv(job):
+    out_filename, rows = job
+    try:
+        with open(out_filename, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['name', 'gpa', 'major'])
+            writer.writerows(rows)
+        return None
+    except Exception as e:
+        return f"Error writing file: {e}"
+
+def _expand_filenames(filename):
+    # One path, a list of paths (one CSV per campus), or a glob pattern
+    if isinstance(filename, os.PathLike):
+        filename = os.fspath(filename)
+    if isinstance(filename, bytes):
+        return [filename]
+    if not isinstance(filename, str):
+        return list(map(os.fspath, filename))
+    if any(char in filename for char in '*?['):  # same test as glob.has_magic
+        import glob
+        matches = sorted(glob.glob(filename))
+        if not matches:
+            print(f"Error: No files match '{filename}'.")
+        return matches
+    return [filename]
+
 class StudentManager:
-    def __init__(self, filename):
+    # stream=True keeps nothing in memory: students are read from the CSV
+    # one row at a time whenever they are iterated.
+    # Several files are parsed concurrently in a process pool of `workers`
+    # processes (None = one per CPU, 1 = serial) and merged in file order.
+    # use_cache=True loads each file through StudentStore.load(), which
+    # reuses the binary <csv>.cache sidecar instead of re-parsing the CSV.
+    def __init__(self, filename, stream=False, workers=None, use_cache=False):
+        self.filename = filename
+        self.filenames = _expand_filenames(filename)
+        self.stream = stream
+        self.workers = workers
         self.students = []
-        try:
-            with open(filename, 'r', newline='') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    student = Student(row['name'], row['gpa'], row['major'])
-                    self.students.append(student)
-        except FileNotFoundError:
-            print(f"Error: File '{filename}' not found.")
-        except Exception as e:
-            print(f"Error reading file: {e}")
+        if stream:
+            return
+        if use_cache:
+            for name in self.filenames:
+                store = StudentStore.load(name)
+                self.students.extend(store.students(range(len(store))))
+        elif len(self.filenames) > 1 and workers != 1:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                for rows in pool.map(_read_csv_rows, self.filenames):
+                    self.students.extend(Student(*row) for row in rows)
+        else:
+            for name in self.filenames:
+                self.students.extend(_iter_csv(name))
+    def iter_students(self):
+        if not self.stream:
+            yield from self.students
+            return
+        for name in self.filenames:
+            yield from _iter_csv(name)
     def print_students(self):
-        for student in self.students:
+        for student in self.iter_students():
             print(student)
     def filter_by_gpa(self, min_gpa):
+        if self.stream:
+            return self.query(min_gpa).students()
         return [s for s in self.students if s.gpa >= min_gpa]
-    def export_filtered(self, filtered, out_filename):
+    def query(self, min_gpa=None, max_gpa=None, majors=None):
+        return StudentQuery(self, min_gpa, max_gpa, majors)
+    def export_filtered(self, filtered, out_filename, shards=1):
+        if shards > 1:
+            return self._export_sharded(filtered, out_filename, shards)
         try:
             with open(out_filename, 'w', newline='') as f:
                 writer = csv.writer(f)
@@ -150,16 +372,334 @@ class StudentManager:
             print(f"Exported filtered students to {out_filename}")
         except Exception as e:
             print(f"Error writing file: {e}")
+    def _export_sharded(self, filtered, out_filename, shards):
+        # Round-robin rows into out_00000.csv, out_00001.csv, ... and write
+        # the shards in parallel
+        root, ext = os.path.splitext(out_filename)
+        names = [f"{root}_{i:05d}{ext}" for i in range(shards)]
+        rows = [[] for _ in range(shards)]
+        for i, s in enumerate(filtered):
+            rows[i % shards].append((s.name, s.gpa, s.major))
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            errors = [e for e in pool.map(_write_csv, zip(names, rows)) if e]
+        for error in errors:
+            print(error)
+        if not errors:
+            print(f"Exported filtered students to {shards} shards: {names[0]} ... {names[-1]}")
+        return names
+    def to_store(self):
+        return StudentStore.from_students(self.iter_students())
+
+class StudentQuery:
+    # Compound filter over a StudentManager: GPA range AND major IN set.
+    # On a streaming manager the predicates run inside the CSV scan; on a
+    # loaded one they run over the Student list. count(), group_by_major()
+    # and top_k() take a single pass and keep only per-major totals or a
+    # k-item heap, never the matching rows.
+    #   manager.query(3.0, majors={"Math"}).top_k(10)
+    #   manager.query().gpa_between(2.0, 3.5).group_by_major()
+    def __init__(self, manager, min_gpa=None, max_gpa=None, majors=None):
+        self.manager = manager
+        self.min_gpa = min_gpa
+        self.max_gpa = max_gpa
+        self.majors = None
+        if majors is not None:
+            self.major_in(*([majors] if isinstance(majors, str) else majors))
+
+    def gpa_between(self, min_gpa=None, max_gpa=None):
+        self.min_gpa = min_gpa
+        self.max_gpa = max_gpa
+        return self
+
+    def major_in(self, *majors):
+        self.majors = frozenset(majors)
+        return self
+
+    def rows(self):
+        # (name, gpa, major) tuples for every matching student
+        low = float('-inf') if self.min_gpa is None else self.min_gpa
+        high = float('inf') if self.max_gpa is None else self.max_gpa
+        majors = self.majors
+        if self.manager.stream:
+            for filename in self.manager.filenames:
+                yield from _scan_csv(filename, low, high, majors)
+            return
+        for s in self.manager.students:
+            if (majors is None or s.major in majors) and low <= s.gpa <= high:
+                yield s.name, s.gpa, s.major
+
+    def students(self):
+        return (Student(*row) for row in self.rows())
+
+    def count(self):
+        return sum(1 for _ in self.rows())
+
+    def group_by_major(self):
+        # {major: {'count': n, 'mean_gpa': mean}} in one pass
+        counts = {}
+        totals = {}
+        for _, gpa, major in self.rows():
+            if major in counts:
+                counts[major] += 1
+                totals[major] += gpa
+            else:
+                counts[major] = 1
+                totals[major] = gpa
+        return {major: {'count': count, 'mean_gpa': totals[major] / count}
+                for major, count in counts.items()}
+
+    def top_k(self, k):
+        # Highest GPAs first; O(n log k) time and O(k) memory
+        best = heapq.nlargest(k, self.rows(), key=operator.itemgetter(1))
+        return [Student(*row) for row in best]
+
+class StudentStore:
+    # Columnar copy of the students: GPA in an array('d'), majors
+    # dictionary-encoded to small ints. Range queries binary-search a
+    # GPA-sorted row index and return zero-copy memoryviews of row numbers.
+    def __init__(self):
+        self.names = []
+        self.gpas = array('d')
+        self.major_codes = array('H')
+        self.majors = []  # code -> major
+        self._major_code = {}  # major -> code
+        self._sorted_rows = None
+        self._sorted_gpas = None
+        self._major_order = None  # rows grouped by major code
+        self._major_offsets = None  # code -> start of its group in _major_order
+        self._mmap = None
+
+    @classmethod
+    def from_students(cls, students):
+        store = cls()
+        for s in students:
+            store.add(s.name, s.gpa, s.major)
+        return store
+
+    @classmethod
+    def from_csv(cls, filename):
+        store = cls()
+        store._read_csv(filename)
+        return store
+
+    def _read_csv(self, filename):
+        # Adds every row; returns False (keeping the rows read so far) if
+        # the file could not be read to the end
+        try:
+            with open(filename, 'r', newline='') as f:
+                for row in csv.DictReader(f):
+                    self.add(row['name'], float(row['gpa']), row['major'])
+        except FileNotFoundError:
+            print(f"Error: File '{filename}' not found.")
+            return False
+        except Exception as e:
+            print(f"Error reading file: {e}")
+            return False
+        return True
+
+    def add(self, name, gpa, major):
+        if self._mmap is not None:
+            raise ValueError("Store loaded from a cache is read-only")
+        code = self._major_code.get(major)
+        if code is None:
+            code = self._major_code[major] = len(self.majors)
+            self.majors.append(major)
+        self.names.append(name)
+        self.gpas.append(gpa)
+        self.major_codes.append(code)
+        self._sorted_rows = self._sorted_gpas = self._major_order = None
+
+    def __len__(self):
+        return len(self.gpas)
+
+    def build_indexes(self):
+        gpas = self.gpas
+        order = sorted(range(len(gpas)), key=gpas.__getitem__)
+        self._sorted_rows = array('I', order)
+        self._sorted_gpas = array('d', [gpas[i] for i in order])
+        codes = self.major_codes
+        self._major_order = array('I', sorted(range(len(codes)), key=codes.__getitem__))
+        counts = [0] * (len(self.majors) + 1)
+        for code in codes:
+            counts[code + 1] += 1
+        for code in range(len(self.majors)):
+            counts[code + 1] += counts[code]
+        self._major_offsets = array('Q', counts)
+
+    def filter_by_gpa(self, min_gpa, max_gpa=None):
+        # Row numbers with min_gpa <= gpa (<= max_gpa), in GPA order
+        if self._sorted_rows is None:
+            self.build_indexes()
+        lo = bisect_left(self._sorted_gpas, min_gpa)
+        if max_gpa is None:
+            hi = len(self._sorted_gpas)
+        else:
+            hi = bisect_right(self._sorted_gpas, max_gpa, lo)
+        return memoryview(self._sorted_rows)[lo:hi]
+
+    def rows_for_major(self, major):
+        if self._major_order is None:
+            self.build_indexes()
+        code = self._major_code.get(major)
+        if code is None:
+            return memoryview(array('I'))
+        start, stop = self._major_offsets[code], self._major_offsets[code + 1]
+        return memoryview(self._major_order)[start:stop]
+
+    def student(self, row):
+        return Student(self.names[row], self.gpas[row], self.majors[self.major_codes[row]])
+
+    def students(self, rows):
+        for row in rows:
+            yield self.student(row)
+
+    # Binary cache: a sidecar file next to the CSV holding every column and
+    # index, keyed on the CSV's mtime and size. Loading it mmaps the file and
+    # casts each section to a typed memoryview, so nothing is parsed or copied.
+    # A store loaded from cache is read-only.
+    CACHE_MAGIC = b'STUDENT1'
+    # magic, csv mtime_ns, csv size, rows, major count, names bytes, majors bytes
+    CACHE_HEADER = struct.Struct('<8sqqQQQQ')
+
+    @classmethod
+    def load(cls, filename, use_cache=True):
+        filename = os.fspath(filename)
+        cache_path = filename + '.cache'
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            print(f"Error: File '{filename}' not found.")
+            return cls()
+        if use_cache:
+            store = cls._open_cache(cache_path, stat)
+            if store is not None:
+                return store
+        store = cls()
+        # Never cache a partial parse: later loads would return it silently
+        if store._read_csv(filename) and use_cache:
+            store.save_cache(cache_path, stat)
+        return store
+
+    def save_cache(self, cache_path, stat):
+        if self._sorted_rows is None or self._major_order is None:
+            self.build_indexes()
+        encoded = [name.encode('utf-8') for name in self.names]
+        offsets = array('Q', [0])
+        total = 0
+        for name in encoded:
+            total += len(name)
+            offsets.append(total)
+        names = b''.join(encoded)
+        majors = '\0'.join(self.majors).encode('utf-8')
+        sections = [self.gpas, self._sorted_gpas, self._sorted_rows,
+                    self.major_codes, self._major_order, offsets,
+                    self._major_offsets, names, majors]
+        tmp_path = cache_path + '.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(self.CACHE_HEADER.pack(self.CACHE_MAGIC, stat.st_mtime_ns,
+                                               stat.st_size, len(self), len(self.majors),
+                                               len(names), len(majors)))
+                for section in sections:
+                    data = memoryview(section).cast('B')
+                    f.write(data)
+                    f.write(b'\0' * (-len(data) % 8))
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            print(f"Error writing cache: {e}")
+
+    @classmethod
+    def _open_cache(cls, cache_path, stat):
+        try:
+            with open(cache_path, 'rb') as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        header = cls.CACHE_HEADER
+        if len(mm) < header.size:
+            mm.close()
+            return None
+        magic, mtime_ns, size, rows, major_count, names_len, majors_len = header.unpack_from(mm)
+        if (magic, mtime_ns, size) != (cls.CACHE_MAGIC, stat.st_mtime_ns, stat.st_size):
+            mm.close()
+            return None
+        # Section sizes in file order, as written by save_cache()
+        sizes = [rows * 8, rows * 8, rows * 4, rows * 2, rows * 4, (rows + 1) * 8,
+                 (major_count + 1) * 8, names_len, majors_len]
+        if len(mm) < header.size + sum(n + (-n % 8) for n in sizes):
+            mm.close()  # truncated
+            return None
+
+        view = memoryview(mm)
+        views = [view]
+        pos = header.size
+
+        def section(nbytes, fmt):
+            nonlocal pos
+            data = view[pos:pos + nbytes]
+            views.append(data)
+            pos += nbytes + (-nbytes % 8)
+            if fmt:
+                data = data.cast(fmt)
+                views.append(data)
+            return data
+
+        store = cls()
+        try:
+            store.gpas = section(rows * 8, 'd')
+            store._sorted_gpas = section(rows * 8, 'd')
+            store._sorted_rows = section(rows * 4, 'I')
+            store.major_codes = section(rows * 2, 'H')
+            store._major_order = section(rows * 4, 'I')
+            name_offsets = section((rows + 1) * 8, 'Q')
+            store._major_offsets = section((major_count + 1) * 8, 'Q')
+            store.names = _NameColumn(section(names_len, None), name_offsets)
+            majors = str(section(majors_len, None), 'utf-8')
+        except (TypeError, ValueError):
+            # Corrupt cache: drop every view so the mmap can close, then
+            # fall back to the CSV
+            for data in reversed(views):
+                data.release()
+            mm.close()
+            return None
+        store.majors = majors.split('\0') if major_count else []
+        store._major_code = {major: code for code, major in enumerate(store.majors)}
+        store._mmap = mm
+        return store
+
+
+class _NameColumn:
+    # Read-only view of names stored as one UTF-8 blob plus offsets
+    def __init__(self, blob, offsets):
+        self._blob = blob
+        self._offsets = offsets
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, row):
+        return str(self._blob[self._offsets[row]:self._offsets[row + 1]], 'utf-8')
 
 # Example usage:
-filename = 'students.csv'  # Make sure this file exists with columns: name,gpa,major
-manager = StudentManager(filename)
-print("All students:")
-manager.print_students()
-
-min_gpa = 3.0
-filtered = manager.filter_by_gpa(min_gpa)
-print(f"\nStudents with GPA >= {min_gpa}:")
-for s in filtered:
-    print(s)
-manager.export_filtered(filtered, 'filtered_students.csv')
+def challenge3(filename='students.csv'):  # Make sure this file exists with columns: name,gpa,major
+    print("\nCHALLENGE 2\n")
+
+    manager = StudentManager(filename)
+    print("All students:")
+    manager.print_students()
+
+    min_gpa = 3.0
+    filtered = manager.filter_by_gpa(min_gpa)
+    print(f"\nStudents with GPA >= {min_gpa}:")
+    for s in filtered:
+        print(s)
+    manager.export_filtered(filtered, 'filtered_students.csv')
+
+def main():
+    challenge1()
+    challenge2()
+    challenge3()
+
+if __name__ == '__main__':
+    main()